@@ -9,21 +9,52 @@ It provides functionality to:
 """
 
 import os
+import pickle
+import operator
 import logging
 import yaml
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 import discord
 from discord.ext import commands
 
 import config
 
+# Prefer the libyaml-backed loader when available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Set up logging
 logger = logging.getLogger("discord_bot.character_loader")
 
+def _copy_embed(data: Dict[str, Any]) -> discord.Embed:
+    """Create an embed from a stored embed dict.
+    
+    Embed.from_dict keeps references to the dict's fields list, so each embed
+    gets its own copy of the fields.
+    
+    Args:
+        data: The embed data from Embed.to_dict
+        
+    Returns:
+        A new embed
+    """
+    return discord.Embed.from_dict({**data, 'fields': [dict(field) for field in data.get('fields', ())]})
+
 class Character:
     """Class representing a character from a YAML file."""
     
+    __slots__ = (
+        'id', 'name', 'title', 'starting_year', 'initial_capital', 'key_principles',
+        'decisions', 'analysis_templates', 'sorted_decisions',
+        '_decisions_tuple', '_total_decisions', '_correct', '_correct_bytes', '_choice_scores',
+        '_max_score_per_decision', '_max_score_total', '_analysis_bands',
+        '_intro_embed_dict', '_decision_embed_dicts'
+    )
+    
     def __init__(self, character_id: str, data: Dict[str, Any]):
         """Initialize a Character object.
         
@@ -40,11 +71,39 @@ class Character:
         self.decisions = data.get('decisions', {})
         self.analysis_templates = data.get('analysis_templates', {})
         
-        # Sort decisions by key (which should be numeric)
+        # Sort decisions by key (validated to be numeric)
         self.sorted_decisions = sorted(
-            self.decisions.items(), 
-            key=lambda x: int(x[0]) if isinstance(x[0], (int, str)) and str(x[0]).isdigit() else 0
+            ((int(key), decision) for key, decision in self.decisions.items()),
+            key=lambda x: x[0]
         )
+        
+        # Flat lookup tables for the gameplay hot path (index = decision number - 1)
+        self._decisions_tuple = tuple(decision for _, decision in self.sorted_decisions)
+        self._total_decisions = len(self._decisions_tuple)
+        self._correct = tuple(decision.get('correct_choice') for decision in self._decisions_tuple)
+        # Single-letter choices as bytes, for comparing against a session's choice
+        # bytearray; 0xFF never matches a choice or an unmade (0) decision
+        self._correct_bytes = bytes(
+            ord(choice) if isinstance(choice, str) and len(choice) == 1 and choice.isascii() else 0xFF
+            for choice in self._correct
+        )
+        self._choice_scores = tuple(
+            {choice_id: choice_data.get('score', 0) for choice_id, choice_data in decision.get('choices', {}).items()}
+            for decision in self._decisions_tuple
+        )
+        self._max_score_per_decision = tuple(max([0, *scores.values()]) for scores in self._choice_scores)
+        self._max_score_total = sum(self._max_score_per_decision)
+        
+        # Analysis templates indexed by performance band (excellent, good, needs improvement)
+        self._analysis_bands = (
+            self.analysis_templates.get('excellent', {'text': 'Excellent performance!', 'principles': []}),
+            self.analysis_templates.get('good', {'text': 'Good performance!', 'principles': []}),
+            self.analysis_templates.get('needs_improvement', {'text': 'Needs improvement.', 'principles': []})
+        )
+        
+        # Character intro and per-decision embeds, built on first use
+        self._intro_embed_dict: Optional[Dict[str, Any]] = None
+        self._decision_embed_dicts: List[Optional[Dict[str, Any]]] = [None] * self._total_decisions
     
     def get_decision(self, number: int) -> Optional[Dict[str, Any]]:
         """Get a specific decision by number.
@@ -55,11 +114,8 @@ class Character:
         Returns:
             The decision data or None if not found
         """
-        if number <= 0 or number > len(self.sorted_decisions):
-            return None
-        
-        # Decisions are 1-indexed in the list
-        return self.sorted_decisions[number - 1][1]
+        # Decisions are 1-indexed
+        return self._decisions_tuple[number - 1] if 1 <= number <= self._total_decisions else None
     
     def get_total_decisions(self) -> int:
         """Get the total number of decisions for this character.
@@ -67,7 +123,7 @@ class Character:
         Returns:
             The total number of decisions
         """
-        return len(self.sorted_decisions)
+        return self._total_decisions
     
     def get_choice_score(self, decision_number: int, choice: str) -> int:
         """Get the score for a specific choice in a decision.
@@ -79,15 +135,10 @@ class Character:
         Returns:
             The score for the choice or 0 if not found
         """
-        decision = self.get_decision(decision_number)
-        if not decision or 'choices' not in decision:
+        if not 1 <= decision_number <= self._total_decisions:
             return 0
         
-        choices = decision.get('choices', {})
-        if choice in choices and 'score' in choices[choice]:
-            return choices[choice]['score']
-        
-        return 0
+        return self._choice_scores[decision_number - 1].get(choice, 0)
     
     def is_correct_choice(self, decision_number: int, choice: str) -> bool:
         """Check if a choice is the historically correct one.
@@ -99,11 +150,29 @@ class Character:
         Returns:
             True if the choice is correct, False otherwise
         """
-        decision = self.get_decision(decision_number)
-        if not decision or 'correct_choice' not in decision:
+        if not 1 <= decision_number <= self._total_decisions:
             return False
         
-        return decision['correct_choice'] == choice
+        return self._correct[decision_number - 1] == choice
+    
+    def count_correct_choices(self, choices: bytes) -> int:
+        """Count how many choices match the historically correct ones.
+        
+        Args:
+            choices: One choice letter per decision, in decision order
+            
+        Returns:
+            The number of correct choices
+        """
+        return sum(map(operator.eq, choices, self._correct_bytes))
+    
+    def get_max_score(self) -> int:
+        """Get the maximum possible score for this character.
+        
+        Returns:
+            The sum of the highest scoring choice in each decision
+        """
+        return self._max_score_total
     
     def get_analysis(self, score_percentage: float) -> Dict[str, Any]:
         """Get the appropriate analysis template based on score percentage.
@@ -114,12 +183,71 @@ class Character:
         Returns:
             The analysis template data
         """
-        if score_percentage >= 80:
-            return self.analysis_templates.get('excellent', {'text': 'Excellent performance!', 'principles': []})
-        elif score_percentage >= 60:
-            return self.analysis_templates.get('good', {'text': 'Good performance!', 'principles': []})
-        else:
-            return self.analysis_templates.get('needs_improvement', {'text': 'Needs improvement.', 'principles': []})
+        return self._analysis_bands[0 if score_percentage >= 80 else 1 if score_percentage >= 60 else 2]
+    
+    def get_intro_embed(self) -> discord.Embed:
+        """Get the embed introducing this character at the start of a game.
+        
+        Returns:
+            A new embed that the caller is free to modify
+        """
+        if self._intro_embed_dict is None:
+            embed = discord.Embed(
+                title=f"Playing as {self.name}",
+                description=f"**{self.title}**\n\nStarting Year: {self.starting_year}\nInitial Capital: ${self.initial_capital:,}",
+                color=config.EMBED_COLOR
+            )
+            
+            # Add key principles
+            if self.key_principles:
+                principles = "\n".join(f"• {principle}" for principle in self.key_principles)
+                embed.add_field(name="Key Principles", value=principles, inline=False)
+            
+            # Add game info
+            embed.add_field(
+                name="Game Information",
+                value=f"You'll face {self._total_decisions} key decisions that shaped {self.name}'s career.\nMake your choices wisely!",
+                inline=False
+            )
+            
+            self._intro_embed_dict = embed.to_dict()
+        
+        return _copy_embed(self._intro_embed_dict)
+    
+    def get_decision_embed(self, number: int) -> Optional[discord.Embed]:
+        """Get the embed presenting a decision, without the progress footer.
+        
+        Args:
+            number: The decision number (1-based)
+            
+        Returns:
+            A new embed that the caller is free to modify, or None if not found
+        """
+        decision = self.get_decision(number)
+        if decision is None:
+            return None
+        
+        data = self._decision_embed_dicts[number - 1]
+        if data is None:
+            embed = discord.Embed(
+                title=f"Decision {number}: {self.name} ({decision['year']})",
+                description=decision['context'],
+                color=config.EMBED_COLOR
+            )
+            
+            # Add question
+            embed.add_field(name="Decision", value=decision['question'], inline=False)
+            
+            # Add choices
+            choices_text = "".join(
+                f"**Option {choice_id.upper()}**: {choice_data['text']}\n\n"
+                for choice_id, choice_data in decision['choices'].items()
+            )
+            embed.add_field(name="Options", value=choices_text, inline=False)
+            
+            data = self._decision_embed_dicts[number - 1] = embed.to_dict()
+        
+        return _copy_embed(data)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the character to a dictionary.
@@ -157,6 +285,8 @@ class CharacterLoader(commands.Cog):
         self.bot = bot
         self.characters: Dict[str, Character] = {}
         self.characters_dir = config.CHARACTERS_DIR
+        self.cache_path = config.CHARACTER_CACHE_PATH
+        self._parse_cache: Dict[str, Tuple[float, int, Any]] = {}
         
         # Load all characters
         self._load_all_characters()
@@ -170,31 +300,150 @@ class CharacterLoader(commands.Cog):
         
         # Get all YAML files in the characters directory
         try:
-            files = [f for f in os.listdir(self.characters_dir) if f.endswith('.yml') or f.endswith('.yaml')]
+            with os.scandir(self.characters_dir) as it:
+                entries = [e for e in it if e.is_file() and e.name.endswith(('.yml', '.yaml'))]
         except FileNotFoundError:
             logger.error(f"Characters directory not found: {self.characters_dir}")
             return
         
-        # Load each file
-        for filename in files:
-            character_id = os.path.splitext(filename)[0]
-            filepath = os.path.join(self.characters_dir, filename)
+        # Reuse parsed data for files that haven't changed since the last load
+        self._parse_cache = self._read_parse_cache()
+        
+        stats = {}
+        cached_data = {}
+        stale = []
+        for entry in entries:
+            try:
+                stat = stats[entry.path] = entry.stat()
+            except OSError as e:
+                logger.error(f"Error loading character {os.path.splitext(entry.name)[0]}: {e}")
+                continue
+            cached = self._parse_cache.get(entry.path)
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                cached_data[entry.path] = cached[2]
+            else:
+                stale.append(entry)
+        
+        parsed = self._parse_files(stale)
+        
+        new_cache = {}
+        for entry in entries:
+            character_id = os.path.splitext(entry.name)[0]
             
             try:
-                with open(filepath, 'r', encoding='utf-8') as file:
-                    data = yaml.safe_load(file)
+                if entry.path in cached_data:
+                    # Only validated data is cached, so an unchanged file skips validation
+                    data = cached_data[entry.path]
+                elif entry.path in parsed:
+                    data = parsed[entry.path]
+                    
+                    # Validate character data
+                    if not self._validate_character(character_id, data):
+                        continue
+                else:
+                    # Failed to stat, read or parse; already logged
+                    continue
                 
-                # Validate character data
-                if self._validate_character(character_id, data):
-                    # Create Character object
-                    character = Character(character_id, data)
-                    self.characters[character_id] = character
-                    logger.info(f"Loaded character: {character.name} ({character_id})")
+                # Create Character object
+                character = Character(character_id, data)
             except Exception as e:
                 logger.error(f"Error loading character {character_id}: {e}")
+                continue
+            
+            self.characters[character_id] = character
+            stat = stats[entry.path]
+            new_cache[entry.path] = (stat.st_mtime, stat.st_size, data)
+            logger.info(f"Loaded character: {character.name} ({character_id})")
+        
+        if new_cache != self._parse_cache:
+            self._write_parse_cache(new_cache)
+        self._parse_cache = new_cache
         
         logger.info(f"Loaded {len(self.characters)} characters")
     
+    def _read_parse_cache(self) -> Dict[str, Tuple[float, int, Any]]:
+        """Read the on-disk cache of parsed character files.
+        
+        Returns:
+            Dictionary of file path to (mtime, size, validated data), empty if unavailable
+        """
+        try:
+            with open(self.cache_path, 'rb') as file:
+                cache = pickle.load(file)
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable character cache {self.cache_path}: {e}")
+            return {}
+    
+    def _write_parse_cache(self, cache: Dict[str, Tuple[float, int, Any]]) -> None:
+        """Atomically write the cache of parsed character files.
+        
+        Args:
+            cache: Dictionary of file path to (mtime, size, data)
+        """
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as file:
+                pickle.dump(cache, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to write character cache {self.cache_path}: {e}")
+    
+    def _read_file(self, entry: os.DirEntry) -> Optional[bytes]:
+        """Read the raw contents of a character file.
+        
+        Args:
+            entry: The directory entry for the YAML file
+            
+        Returns:
+            The file contents or None if reading failed
+        """
+        try:
+            with open(entry.path, 'rb') as file:
+                return file.read()
+        except OSError as e:
+            logger.error(f"Error loading character {os.path.splitext(entry.name)[0]}: {e}")
+            return None
+    
+    def _parse_files(self, entries: List[os.DirEntry]) -> Dict[str, Any]:
+        """Parse character files as a single multi-document YAML stream.
+        
+        Parsing one joined stream allocates the libyaml parser once instead of
+        once per file. If the joined stream fails to parse or yields an
+        unexpected number of documents, files are parsed one at a time.
+        
+        Args:
+            entries: The directory entries for the YAML files
+            
+        Returns:
+            Dictionary of file path to parsed data (files that failed are omitted)
+        """
+        if not entries:
+            return {}
+        
+        # Read files in parallel; disk reads are independent per character
+        with ThreadPoolExecutor(max_workers=min(32, len(entries))) as executor:
+            contents = list(executor.map(self._read_file, entries))
+        readable = [(entry, content) for entry, content in zip(entries, contents) if content is not None]
+        
+        try:
+            docs = list(yaml.load_all(b"\n---\n".join(content for _, content in readable), Loader=_YamlLoader))
+            if len(docs) == len(readable):
+                return {entry.path: doc for (entry, _), doc in zip(readable, docs)}
+        except yaml.YAMLError:
+            pass
+        
+        # Parse individually so one malformed file doesn't prevent loading the rest
+        parsed = {}
+        for entry, content in readable:
+            try:
+                parsed[entry.path] = yaml.load(content, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                logger.error(f"Error loading character {os.path.splitext(entry.name)[0]}: {e}")
+        return parsed
+    
     def _validate_character(self, character_id: str, data: Dict[str, Any]) -> bool:
         """Validate character data structure.
         
@@ -206,10 +455,10 @@ class CharacterLoader(commands.Cog):
             True if valid, False otherwise
         """
         # Check required fields
-        for field in config.REQUIRED_CHARACTER_FIELDS:
-            if field not in data:
-                logger.error(f"Character {character_id} missing required field: {field}")
-                return False
+        missing = config.REQUIRED_CHARACTER_FIELDS - data.keys()
+        if missing:
+            logger.error(f"Character {character_id} missing required field: {', '.join(sorted(missing))}")
+            return False
         
         # Check decisions structure
         decisions = data.get('decisions', {})
@@ -218,10 +467,15 @@ class CharacterLoader(commands.Cog):
             return False
         
         for decision_id, decision in decisions.items():
-            for field in config.REQUIRED_DECISION_FIELDS:
-                if field not in decision:
-                    logger.error(f"Character {character_id}, decision {decision_id} missing required field: {field}")
-                    return False
+            # Decision keys are sorted numerically, so they must be integers
+            if not str(decision_id).isdigit():
+                logger.error(f"Character {character_id} has non-numeric decision key: {decision_id}")
+                return False
+            
+            missing = config.REQUIRED_DECISION_FIELDS - decision.keys()
+            if missing:
+                logger.error(f"Character {character_id}, decision {decision_id} missing required field: {', '.join(sorted(missing))}")
+                return False
             
             # Check choices structure
             choices = decision.get('choices', {})
@@ -229,6 +483,12 @@ class CharacterLoader(commands.Cog):
                 logger.error(f"Character {character_id}, decision {decision_id} has no choices")
                 return False
             
+            # Sessions record each choice as one byte, so choice keys must be single ASCII characters
+            invalid = [choice_id for choice_id in choices if not (isinstance(choice_id, str) and len(choice_id) == 1 and choice_id.isascii())]
+            if invalid:
+                logger.error(f"Character {character_id}, decision {decision_id} has invalid choice keys: {', '.join(map(str, invalid))}")
+                return False
+            
             # Check correct_choice is valid
             correct_choice = decision.get('correct_choice')
             if correct_choice not in choices:
@@ -10,11 +10,12 @@ This cog handles all database operations for the bot, including:
 """
 
 import os
+import time
 import sqlite3
 import logging
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any, Union
+import threading
+from typing import Callable, Dict, List, Tuple, Optional, Any, Union
 
 import discord
 from discord.ext import commands, tasks
@@ -24,6 +25,105 @@ import config
 # Set up logging
 logger = logging.getLogger("discord_bot.database")
 
+# Statements used on hot paths, hoisted so each call reuses the same string
+# object and hits sqlite3's prepared-statement cache
+_SQL_CREATE_USER_IF_MISSING = "INSERT OR IGNORE INTO users (user_id, username, last_played) VALUES (?, ?, CURRENT_TIMESTAMP)"
+_SQL_GET_USER = "SELECT user_id, username, games_played, total_score, last_played FROM users WHERE user_id = ?"
+_SQL_UPDATE_LAST_PLAYED = "UPDATE users SET last_played = CURRENT_TIMESTAMP WHERE user_id = ?"
+_SQL_CREATE_GAME = "INSERT INTO games (user_id, character_id) VALUES (?, ?)"
+_SQL_INCREMENT_GAMES_PLAYED = "UPDATE users SET games_played = games_played + 1 WHERE user_id = ?"
+_SQL_DELETE_USER_SESSIONS = "DELETE FROM active_sessions WHERE user_id = ?"
+# last_activity is written explicitly: databases created by older versions still
+# have a CURRENT_TIMESTAMP (text) default, which would never compare as expired
+_SQL_CREATE_SESSION = (
+    "INSERT INTO active_sessions (session_id, user_id, game_id, channel_id, last_activity) "
+    "VALUES (?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))"
+)
+_SQL_UPDATE_SESSION_ACTIVITY = "UPDATE active_sessions SET last_activity = CAST(strftime('%s', 'now') AS INTEGER) WHERE session_id = ?"
+_SQL_GET_ACTIVE_SESSION = "SELECT * FROM active_sessions WHERE user_id = ?"
+_SQL_END_SESSION = "DELETE FROM active_sessions WHERE session_id = ?"
+_SQL_RECORD_DECISION = "INSERT INTO decisions (game_id, decision_number, choice_made, score) VALUES (?, ?, ?, ?)"
+_SQL_UPDATE_GAME_SCORE = "UPDATE games SET total_score = total_score + ? WHERE game_id = ?"
+_SQL_GET_GAME_SCORE = "SELECT total_score, user_id FROM games WHERE game_id = ?"
+_SQL_COMPLETE_GAME = "UPDATE games SET completed = 1 WHERE game_id = ?"
+_SQL_UPDATE_USER_SCORE = "UPDATE users SET total_score = total_score + ? WHERE user_id = ?"
+_SQL_RECORD_FEEDBACK = "INSERT INTO feedback (game_id, rating, comments) VALUES (?, ?, ?)"
+_SQL_EXPIRED_SESSIONS = "SELECT session_id, user_id, game_id FROM active_sessions WHERE last_activity < ?"
+_SQL_DELETE_EXPIRED_SESSIONS = "DELETE FROM active_sessions WHERE last_activity < ?"
+_SQL_USER_SUMMARY = """
+    WITH user_games AS (
+        SELECT character_id, total_score, completed
+        FROM games
+        WHERE user_id = ?
+    )
+    SELECT
+        (SELECT MAX(total_score) FROM user_games WHERE completed = 1) as top_score,
+        (SELECT AVG(total_score) FROM user_games WHERE completed = 1) as avg_score,
+        (SELECT character_id FROM user_games GROUP BY character_id ORDER BY COUNT(*) DESC LIMIT 1) as favorite_character
+"""
+_SQL_USER_RECENT_GAMES = """
+    SELECT game_id, character_id, total_score, timestamp
+    FROM games
+    WHERE user_id = ? AND completed = 1
+    ORDER BY timestamp DESC
+    LIMIT 5
+"""
+_SQL_LEADERBOARD_CHAR = """
+    SELECT g.user_id, u.username, MAX(g.total_score) as high_score
+    FROM games g
+    JOIN users u ON g.user_id = u.user_id
+    WHERE g.character_id = ? AND g.completed = 1
+    GROUP BY g.user_id
+    ORDER BY high_score DESC
+    LIMIT ?
+"""
+_SQL_LEADERBOARD_ALL = """
+    SELECT g.user_id, u.username, MAX(g.total_score) as high_score
+    FROM games g
+    JOIN users u ON g.user_id = u.user_id
+    WHERE g.completed = 1
+    GROUP BY g.user_id
+    ORDER BY high_score DESC
+    LIMIT ?
+"""
+_SQL_GAME_DECISIONS = """
+    SELECT decision_number, choice_made, score
+    FROM decisions
+    WHERE game_id = ?
+    ORDER BY decision_number
+"""
+
+# Columns that older versions filled from datetime.now() in local time
+_LEGACY_TIMESTAMP_COLUMNS = (
+    ('users', 'last_played'),
+    ('games', 'timestamp'),
+    ('decisions', 'timestamp'),
+    ('feedback', 'timestamp'),
+)
+
+# Upper bound on the entries kept in each read cache
+_CACHE_MAX_ENTRIES = 256
+
+def _cache_store(cache: Dict[Any, Tuple[float, Any]], key: Any, result: Any, ttl: float) -> None:
+    """Store a result in a read cache, evicting expired and excess entries.
+    
+    Entries are re-inserted on every store, so the dict stays ordered oldest
+    first and eviction only has to look at the front.
+    
+    Args:
+        cache: The cache to store into
+        key: The cache key
+        result: The query result
+        ttl: Seconds an entry stays valid
+    """
+    now = time.monotonic()
+    cache.pop(key, None)
+    for old_key in list(cache):
+        if now - cache[old_key][0] < ttl and len(cache) < _CACHE_MAX_ENTRIES:
+            break
+        del cache[old_key]
+    cache[key] = (now, result)
+
 class Database(commands.Cog):
     """Cog for handling database operations."""
     
@@ -36,7 +136,19 @@ class Database(commands.Cog):
         self.bot = bot
         self.db_path = config.DATABASE_PATH
         self.connection = None
-        self.cursor = None
+        self.cursor = None  # Plain tuple rows for internal queries
+        self._row_cursor = None  # sqlite3.Row rows for results returned to callers
+        
+        # Serializes access to the shared connection from worker threads
+        self._lock = threading.Lock()
+        
+        # Short-lived read caches: key -> (monotonic timestamp, result)
+        self._leaderboard_cache: Dict[Tuple[int, Optional[str]], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._stats_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        
+        # Bumped on every game, decision or feedback write so caches outside
+        # this cog (e.g. Analytics) can tell their results are stale
+        self.write_version = 0
         
         # Create database if it doesn't exist
         self._init_database()
@@ -52,9 +164,19 @@ class Database(commands.Cog):
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         # Connect to database
-        self.connection = sqlite3.connect(self.db_path)
-        self.connection.row_factory = sqlite3.Row  # Return rows as dictionaries
+        # Queries run in worker threads (see _run), so allow cross-thread use
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
         self.cursor = self.connection.cursor()
+        self._row_cursor = self.connection.cursor()
+        self._row_cursor.row_factory = sqlite3.Row  # Return rows as dictionaries
+        
+        # Tune SQLite for many small writes: WAL avoids per-commit fsync stalls
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute("PRAGMA mmap_size=134217728")  # 128 MiB
+        self.cursor.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        self.cursor.execute("PRAGMA foreign_keys=ON")
         
         # Create tables
         self._create_tables()
@@ -86,6 +208,19 @@ class Database(commands.Cog):
             FOREIGN KEY (user_id) REFERENCES users (user_id)
         )
         ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_games_user_completed ON games(user_id, completed, total_score DESC)"
+        )
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_games_char_completed ON games(character_id, completed, total_score DESC)"
+        )
+        # Global top scores and recent-game queries in Analytics
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_games_completed_score ON games(completed, total_score DESC)"
+        )
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_games_timestamp ON games(timestamp)"
+        )
         
         # Decisions table
         self.cursor.execute('''
@@ -99,6 +234,9 @@ class Database(commands.Cog):
             FOREIGN KEY (game_id) REFERENCES games (game_id)
         )
         ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_decisions_game ON decisions(game_id, decision_number)"
+        )
         
         # Feedback table
         self.cursor.execute('''
@@ -111,6 +249,9 @@ class Database(commands.Cog):
             FOREIGN KEY (game_id) REFERENCES games (game_id)
         )
         ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_feedback_timestamp ON feedback(timestamp)"
+        )
         
         # Active sessions table (for tracking ongoing games)
         self.cursor.execute('''
@@ -119,45 +260,76 @@ class Database(commands.Cog):
             user_id INTEGER NOT NULL,
             game_id INTEGER NOT NULL,
             channel_id INTEGER NOT NULL,
-            last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_activity INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),  -- Unix epoch seconds
             FOREIGN KEY (user_id) REFERENCES users (user_id),
             FOREIGN KEY (game_id) REFERENCES games (game_id)
         )
         ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sessions_user ON active_sessions(user_id)"
+        )
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sessions_activity ON active_sessions(last_activity)"
+        )
+        
+        # Convert sessions written by older versions, which stored datetime strings
+        self.cursor.execute(
+            "UPDATE active_sessions SET last_activity = CAST(strftime('%s', last_activity) AS INTEGER) "
+            "WHERE typeof(last_activity) = 'text'"
+        )
+        
+        # Older versions also stored local datetime.now() values (with microseconds) where
+        # CURRENT_TIMESTAMP now stores UTC; convert them so both compare and display alike
+        for table, column in _LEGACY_TIMESTAMP_COLUMNS:
+            self.cursor.execute(
+                f"UPDATE {table} SET {column} = datetime({column}, 'utc') "
+                f"WHERE typeof({column}) = 'text' AND {column} LIKE '____-__-__ __:__:__.%'"
+            )
         
         # Commit changes
         self.connection.commit()
+        
+        # Refresh planner statistics so the indexes above are chosen over table scans
+        self.cursor.execute("ANALYZE")
     
-    def _get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
-        """Get a user from the database.
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking database function in a worker thread.
+        
+        Keeps sqlite3 I/O (and commit fsyncs) off the event loop. Calls are
+        serialized with a lock since all of them share one connection and its cursors.
         
         Args:
-            user_id: The Discord user ID
+            func: The blocking function to run
+            *args: Positional arguments for the function
             
         Returns:
-            User data dictionary or None if not found
+            The function's return value
         """
-        self.cursor.execute(
-            "SELECT * FROM users WHERE user_id = ?", 
-            (user_id,)
-        )
-        return self.cursor.fetchone()
+        return await asyncio.to_thread(self._call_locked, func, *args)
+    
+    def _call_locked(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call a function while holding the connection lock."""
+        with self._lock:
+            return func(*args)
     
-    def _create_user(self, user_id: int, username: str) -> None:
-        """Create a new user in the database.
+    async def run_read(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking read-only query function on the shared connection.
+        
+        func is called as ``func(cursor, *args)`` in a worker thread while the
+        connection lock is held. The cursor returns rows as sqlite3.Row and is
+        shared, so each query's rows must be fetched before the next one and
+        before func returns.
         
         Args:
-            user_id: The Discord user ID
-            username: The Discord username
+            func: The blocking query function to run
+            *args: Positional arguments passed after the cursor
+            
+        Returns:
+            The function's return value
         """
-        self.cursor.execute(
-            "INSERT INTO users (user_id, username, last_played) VALUES (?, ?, ?)",
-            (user_id, username, datetime.now())
-        )
-        self.connection.commit()
-        logger.info(f"Created new user: {username} ({user_id})")
+        return await self._run(func, self._row_cursor, *args)
     
-    def get_or_create_user(self, user_id: int, username: str) -> Dict[str, Any]:
+    async def get_or_create_user(self, user_id: int, username: str) -> Dict[str, Any]:
         """Get a user from the database or create if not exists.
         
         Args:
@@ -167,13 +339,26 @@ class Database(commands.Cog):
         Returns:
             User data dictionary
         """
-        user = self._get_user(user_id)
-        if not user:
-            self._create_user(user_id, username)
-            user = self._get_user(user_id)
-        return user
+        return await self._run(self._get_or_create_user, user_id, username)
+    
+    def _get_or_create_user(self, user_id: int, username: str) -> Dict[str, Any]:
+        """Blocking implementation of :meth:`get_or_create_user`."""
+        # Existing users are only read; the insert is skipped without writing anything
+        self.cursor.execute(
+            _SQL_CREATE_USER_IF_MISSING,
+            (user_id, username)
+        )
+        if self.cursor.rowcount:
+            self.connection.commit()
+            self.write_version += 1
+        
+        self._row_cursor.execute(
+            _SQL_GET_USER,
+            (user_id,)
+        )
+        return dict(self._row_cursor.fetchone())
     
-    def create_game(self, user_id: int, character_id: str) -> int:
+    async def create_game(self, user_id: int, character_id: str) -> int:
         """Create a new game session.
         
         Args:
@@ -183,33 +368,40 @@ class Database(commands.Cog):
         Returns:
             The game ID
         """
-        # Update user's last_played timestamp
-        self.cursor.execute(
-            "UPDATE users SET last_played = ? WHERE user_id = ?",
-            (datetime.now(), user_id)
-        )
-        
-        # Create new game
-        self.cursor.execute(
-            "INSERT INTO games (user_id, character_id, timestamp) VALUES (?, ?, ?)",
-            (user_id, character_id, datetime.now())
-        )
-        
-        # Get the game ID
-        game_id = self.cursor.lastrowid
-        
-        # Increment games_played counter
-        self.cursor.execute(
-            "UPDATE users SET games_played = games_played + 1 WHERE user_id = ?",
-            (user_id,)
-        )
+        return await self._run(self._create_game, user_id, character_id)
+    
+    def _create_game(self, user_id: int, character_id: str) -> int:
+        """Blocking implementation of :meth:`create_game`."""
+        # Run all statements in a single transaction (one commit)
+        with self.connection:
+            # Update user's last_played timestamp
+            self.cursor.execute(
+                _SQL_UPDATE_LAST_PLAYED,
+                (user_id,)
+            )
+            
+            # Create new game
+            self.cursor.execute(
+                _SQL_CREATE_GAME,
+                (user_id, character_id)
+            )
+            
+            # Get the game ID
+            game_id = self.cursor.lastrowid
+            
+            # Increment games_played counter
+            self.cursor.execute(
+                _SQL_INCREMENT_GAMES_PLAYED,
+                (user_id,)
+            )
         
-        self.connection.commit()
+        self.write_version += 1
+        self._stats_cache.pop(user_id, None)
         logger.info(f"Created new game: {game_id} for user {user_id} with character {character_id}")
         
         return game_id
     
-    def create_session(self, session_id: str, user_id: int, game_id: int, channel_id: int) -> None:
+    async def create_session(self, session_id: str, user_id: int, game_id: int, channel_id: int) -> None:
         """Create a new active game session.
         
         Args:
@@ -218,42 +410,42 @@ class Database(commands.Cog):
             game_id: The game ID
             channel_id: The Discord channel ID
         """
-        # First, check if user already has an active session
-        self.cursor.execute(
-            "SELECT * FROM active_sessions WHERE user_id = ?",
-            (user_id,)
-        )
-        existing_session = self.cursor.fetchone()
-        
-        if existing_session:
-            # Delete the existing session
+        await self._run(self._create_session, session_id, user_id, game_id, channel_id)
+    
+    def _create_session(self, session_id: str, user_id: int, game_id: int, channel_id: int) -> None:
+        """Blocking implementation of :meth:`create_session`."""
+        # Replace any existing session for this user in a single transaction
+        with self.connection:
             self.cursor.execute(
-                "DELETE FROM active_sessions WHERE user_id = ?",
+                _SQL_DELETE_USER_SESSIONS,
                 (user_id,)
             )
+            
+            # Create new session
+            self.cursor.execute(
+                _SQL_CREATE_SESSION,
+                (session_id, user_id, game_id, channel_id)
+            )
         
-        # Create new session
-        self.cursor.execute(
-            "INSERT INTO active_sessions (session_id, user_id, game_id, channel_id, last_activity) VALUES (?, ?, ?, ?, ?)",
-            (session_id, user_id, game_id, channel_id, datetime.now())
-        )
-        
-        self.connection.commit()
         logger.info(f"Created new session: {session_id} for user {user_id}, game {game_id}")
     
-    def update_session_activity(self, session_id: str) -> None:
+    async def update_session_activity(self, session_id: str) -> None:
         """Update the last activity timestamp for a session.
         
         Args:
             session_id: The session ID
         """
+        await self._run(self._update_session_activity, session_id)
+    
+    def _update_session_activity(self, session_id: str) -> None:
+        """Blocking implementation of :meth:`update_session_activity`."""
         self.cursor.execute(
-            "UPDATE active_sessions SET last_activity = ? WHERE session_id = ?",
-            (datetime.now(), session_id)
+            _SQL_UPDATE_SESSION_ACTIVITY,
+            (session_id,)
         )
         self.connection.commit()
     
-    def get_active_session(self, user_id: int) -> Optional[Dict[str, Any]]:
+    async def get_active_session(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get the active session for a user.
         
         Args:
@@ -262,26 +454,34 @@ class Database(commands.Cog):
         Returns:
             Session data dictionary or None if not found
         """
-        self.cursor.execute(
-            "SELECT * FROM active_sessions WHERE user_id = ?",
+        return await self._run(self._get_active_session, user_id)
+    
+    def _get_active_session(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_active_session`."""
+        self._row_cursor.execute(
+            _SQL_GET_ACTIVE_SESSION,
             (user_id,)
         )
-        return self.cursor.fetchone()
+        return self._row_cursor.fetchone()
     
-    def end_session(self, session_id: str) -> None:
+    async def end_session(self, session_id: str) -> None:
         """End an active game session.
         
         Args:
             session_id: The session ID
         """
+        await self._run(self._end_session, session_id)
+    
+    def _end_session(self, session_id: str) -> None:
+        """Blocking implementation of :meth:`end_session`."""
         self.cursor.execute(
-            "DELETE FROM active_sessions WHERE session_id = ?",
+            _SQL_END_SESSION,
             (session_id,)
         )
         self.connection.commit()
         logger.info(f"Ended session: {session_id}")
     
-    def record_decision(self, game_id: int, decision_number: int, choice: str, score: int) -> None:
+    async def record_decision(self, game_id: int, decision_number: int, choice: str, score: int) -> None:
         """Record a decision made in a game.
         
         Args:
@@ -290,21 +490,93 @@ class Database(commands.Cog):
             choice: The choice made (e.g., 'a', 'b', 'c')
             score: The score for this decision
         """
-        self.cursor.execute(
-            "INSERT INTO decisions (game_id, decision_number, choice_made, score, timestamp) VALUES (?, ?, ?, ?, ?)",
-            (game_id, decision_number, choice, score, datetime.now())
-        )
+        await self._run(self._record_decision, game_id, decision_number, choice, score)
+    
+    def _record_decision(self, game_id: int, decision_number: int, choice: str, score: int) -> None:
+        """Blocking implementation of :meth:`record_decision`."""
+        with self.connection:
+            self.cursor.execute(
+                _SQL_RECORD_DECISION,
+                (game_id, decision_number, choice, score)
+            )
+            
+            # Update total score in games table
+            self.cursor.execute(
+                _SQL_UPDATE_GAME_SCORE,
+                (score, game_id)
+            )
         
-        # Update total score in games table
-        self.cursor.execute(
-            "UPDATE games SET total_score = total_score + ? WHERE game_id = ?",
-            (score, game_id)
-        )
+        self.write_version += 1
+        logger.info(f"Recorded decision {decision_number} for game {game_id}: choice {choice}, score {score}")
+    
+    async def record_decision_and_touch(self, game_id: int, decision_number: int, choice: str, score: int, session_id: str) -> None:
+        """Record a decision and update its session's activity in one transaction.
         
-        self.connection.commit()
+        Args:
+            game_id: The game ID
+            decision_number: The decision number (1-based)
+            choice: The choice made (e.g., 'a', 'b', 'c')
+            score: The score for this decision
+            session_id: The ID of the session the decision was made in
+        """
+        await self._run(self._record_decision_and_touch, game_id, decision_number, choice, score, session_id)
+    
+    def _record_decision_and_touch(self, game_id: int, decision_number: int, choice: str, score: int, session_id: str) -> None:
+        """Blocking implementation of :meth:`record_decision_and_touch`."""
+        with self.connection:
+            self.cursor.execute(
+                _SQL_RECORD_DECISION,
+                (game_id, decision_number, choice, score)
+            )
+            
+            # Update total score in games table
+            self.cursor.execute(
+                _SQL_UPDATE_GAME_SCORE,
+                (score, game_id)
+            )
+            
+            # Update session activity
+            self.cursor.execute(
+                _SQL_UPDATE_SESSION_ACTIVITY,
+                (session_id,)
+            )
+        
+        self.write_version += 1
         logger.info(f"Recorded decision {decision_number} for game {game_id}: choice {choice}, score {score}")
     
-    def complete_game(self, game_id: int) -> int:
+    async def record_decisions_bulk(self, decisions: List[Tuple[int, int, str, int]], session_ids: List[str]) -> None:
+        """Record a batch of decisions and touch their sessions in one transaction.
+        
+        Args:
+            decisions: List of (game_id, decision_number, choice, score) tuples
+            session_ids: IDs of the sessions the decisions were made in
+        """
+        await self._run(self._record_decisions_bulk, decisions, session_ids)
+    
+    def _record_decisions_bulk(self, decisions: List[Tuple[int, int, str, int]], session_ids: List[str]) -> None:
+        """Blocking implementation of :meth:`record_decisions_bulk`."""
+        with self.connection:
+            self.cursor.executemany(
+                _SQL_RECORD_DECISION,
+                decisions
+            )
+            
+            # Update total scores in games table
+            self.cursor.executemany(
+                _SQL_UPDATE_GAME_SCORE,
+                [(score, game_id) for game_id, _, _, score in decisions]
+            )
+            
+            # Update session activity
+            self.cursor.executemany(
+                _SQL_UPDATE_SESSION_ACTIVITY,
+                [(session_id,) for session_id in set(session_ids)]
+            )
+        
+        self.write_version += 1
+        logger.info(f"Recorded {len(decisions)} decisions in bulk")
+    
+    async def complete_game(self, game_id: int) -> int:
         """Mark a game as completed and update user's total score.
         
         Args:
@@ -313,33 +585,40 @@ class Database(commands.Cog):
         Returns:
             The final total score
         """
-        # Get the game's total score
-        self.cursor.execute(
-            "SELECT total_score, user_id FROM games WHERE game_id = ?",
-            (game_id,)
-        )
-        game = self.cursor.fetchone()
-        total_score = game['total_score']
-        user_id = game['user_id']
-        
-        # Mark game as completed
-        self.cursor.execute(
-            "UPDATE games SET completed = 1 WHERE game_id = ?",
-            (game_id,)
-        )
-        
-        # Update user's total score
-        self.cursor.execute(
-            "UPDATE users SET total_score = total_score + ? WHERE user_id = ?",
-            (total_score, user_id)
-        )
+        return await self._run(self._complete_game, game_id)
+    
+    def _complete_game(self, game_id: int) -> int:
+        """Blocking implementation of :meth:`complete_game`."""
+        # Run all statements in a single transaction, rolled back if any of them fails
+        with self.connection:
+            # Get the game's total score
+            self.cursor.execute(
+                _SQL_GET_GAME_SCORE,
+                (game_id,)
+            )
+            total_score, user_id = self.cursor.fetchone()
+            
+            # Mark game as completed
+            self.cursor.execute(
+                _SQL_COMPLETE_GAME,
+                (game_id,)
+            )
+            
+            # Update user's total score
+            self.cursor.execute(
+                _SQL_UPDATE_USER_SCORE,
+                (total_score, user_id)
+            )
         
-        self.connection.commit()
+        # Scores changed, so cached leaderboards and this user's stats are stale
+        self.write_version += 1
+        self._leaderboard_cache.clear()
+        self._stats_cache.pop(user_id, None)
         logger.info(f"Completed game {game_id} with total score {total_score}")
         
         return total_score
     
-    def record_feedback(self, game_id: int, rating: int, comments: Optional[str] = None) -> None:
+    async def record_feedback(self, game_id: int, rating: int, comments: Optional[str] = None) -> None:
         """Record feedback for a game.
         
         Args:
@@ -347,14 +626,19 @@ class Database(commands.Cog):
             rating: The rating (1-5)
             comments: Optional comments
         """
+        await self._run(self._record_feedback, game_id, rating, comments)
+    
+    def _record_feedback(self, game_id: int, rating: int, comments: Optional[str] = None) -> None:
+        """Blocking implementation of :meth:`record_feedback`."""
         self.cursor.execute(
-            "INSERT INTO feedback (game_id, rating, comments, timestamp) VALUES (?, ?, ?, ?)",
-            (game_id, rating, comments, datetime.now())
+            _SQL_RECORD_FEEDBACK,
+            (game_id, rating, comments)
         )
         self.connection.commit()
+        self.write_version += 1
         logger.info(f"Recorded feedback for game {game_id}: rating {rating}")
     
-    def get_user_stats(self, user_id: int) -> Dict[str, Any]:
+    async def get_user_stats(self, user_id: int) -> Dict[str, Any]:
         """Get statistics for a user.
         
         Args:
@@ -363,52 +647,35 @@ class Database(commands.Cog):
         Returns:
             Dictionary with user statistics
         """
-        # Get user data
-        user = self.get_or_create_user(user_id, "Unknown")  # Fallback username
-        
-        # Get top score
-        self.cursor.execute(
-            "SELECT MAX(total_score) as top_score FROM games WHERE user_id = ? AND completed = 1",
-            (user_id,)
-        )
-        top_score_result = self.cursor.fetchone()
-        top_score = top_score_result['top_score'] if top_score_result and top_score_result['top_score'] else 0
+        cached = self._stats_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < config.STATS_CACHE_TTL:
+            return cached[1]
         
-        # Get favorite character
-        self.cursor.execute(
-            """
-            SELECT character_id, COUNT(*) as count 
-            FROM games 
-            WHERE user_id = ? 
-            GROUP BY character_id 
-            ORDER BY count DESC 
-            LIMIT 1
-            """,
-            (user_id,)
-        )
-        favorite_character_result = self.cursor.fetchone()
-        favorite_character = favorite_character_result['character_id'] if favorite_character_result else "None"
+        stats = await self._run(self._get_user_stats, user_id)
+        _cache_store(self._stats_cache, user_id, stats, config.STATS_CACHE_TTL)
+        return stats
+    
+    def _get_user_stats(self, user_id: int) -> Dict[str, Any]:
+        """Blocking implementation of :meth:`get_user_stats`."""
+        # Get user data
+        user = self._get_or_create_user(user_id, "Unknown")  # Fallback username
         
-        # Get average score
+        # Get top score, average score and favorite character in one round trip
         self.cursor.execute(
-            "SELECT AVG(total_score) as avg_score FROM games WHERE user_id = ? AND completed = 1",
+            _SQL_USER_SUMMARY,
             (user_id,)
         )
-        avg_score_result = self.cursor.fetchone()
-        avg_score = round(avg_score_result['avg_score']) if avg_score_result and avg_score_result['avg_score'] else 0
+        top_score, avg_score, favorite_character = self.cursor.fetchone()
+        top_score = top_score or 0
+        avg_score = round(avg_score) if avg_score else 0
+        favorite_character = favorite_character or "None"
         
         # Get recent games
-        self.cursor.execute(
-            """
-            SELECT game_id, character_id, total_score, timestamp 
-            FROM games 
-            WHERE user_id = ? AND completed = 1
-            ORDER BY timestamp DESC 
-            LIMIT 5
-            """,
+        self._row_cursor.execute(
+            _SQL_USER_RECENT_GAMES,
             (user_id,)
         )
-        recent_games = self.cursor.fetchall()
+        recent_games = self._row_cursor.fetchall()
         
         return {
             'user_id': user_id,
@@ -422,7 +689,7 @@ class Database(commands.Cog):
             'last_played': user['last_played']
         }
     
-    def get_leaderboard(self, limit: int = 10, character_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def get_leaderboard(self, limit: int = 10, character_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get the leaderboard of top players.
         
         Args:
@@ -432,38 +699,33 @@ class Database(commands.Cog):
         Returns:
             List of leaderboard entries
         """
+        key = (limit, character_id)
+        cached = self._leaderboard_cache.get(key)
+        if cached and time.monotonic() - cached[0] < config.LEADERBOARD_CACHE_TTL:
+            return cached[1]
+        
+        leaderboard = await self._run(self._get_leaderboard, limit, character_id)
+        _cache_store(self._leaderboard_cache, key, leaderboard, config.LEADERBOARD_CACHE_TTL)
+        return leaderboard
+    
+    def _get_leaderboard(self, limit: int = 10, character_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_leaderboard`."""
         if character_id:
             # Get leaderboard for specific character
-            self.cursor.execute(
-                """
-                SELECT g.user_id, u.username, MAX(g.total_score) as high_score 
-                FROM games g
-                JOIN users u ON g.user_id = u.user_id
-                WHERE g.character_id = ? AND g.completed = 1
-                GROUP BY g.user_id
-                ORDER BY high_score DESC
-                LIMIT ?
-                """,
+            self._row_cursor.execute(
+                _SQL_LEADERBOARD_CHAR,
                 (character_id, limit)
             )
         else:
             # Get overall leaderboard
-            self.cursor.execute(
-                """
-                SELECT g.user_id, u.username, MAX(g.total_score) as high_score 
-                FROM games g
-                JOIN users u ON g.user_id = u.user_id
-                WHERE g.completed = 1
-                GROUP BY g.user_id
-                ORDER BY high_score DESC
-                LIMIT ?
-                """,
+            self._row_cursor.execute(
+                _SQL_LEADERBOARD_ALL,
                 (limit,)
             )
         
-        return self.cursor.fetchall()
+        return self._row_cursor.fetchall()
     
-    def get_game_decisions(self, game_id: int) -> List[Dict[str, Any]]:
+    async def get_game_decisions(self, game_id: int) -> List[Dict[str, Any]]:
         """Get all decisions made in a game.
         
         Args:
@@ -472,45 +734,67 @@ class Database(commands.Cog):
         Returns:
             List of decision dictionaries
         """
-        self.cursor.execute(
-            """
-            SELECT decision_number, choice_made, score 
-            FROM decisions 
-            WHERE game_id = ? 
-            ORDER BY decision_number
-            """,
+        return await self._run(self._get_game_decisions, game_id)
+    
+    def _get_game_decisions(self, game_id: int) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_game_decisions`."""
+        self._row_cursor.execute(
+            _SQL_GAME_DECISIONS,
             (game_id,)
         )
-        return self.cursor.fetchall()
+        return self._row_cursor.fetchall()
+    
+    def _delete_expired_sessions(self, cutoff: int) -> List[Dict[str, Any]]:
+        """Delete sessions that were last active before a cutoff.
+        
+        Args:
+            cutoff: Epoch seconds; sessions last active before this are removed
+            
+        Returns:
+            The deleted (session_id, user_id, game_id) rows
+        """
+        with self.connection:
+            self.cursor.execute(
+                _SQL_EXPIRED_SESSIONS,
+                (cutoff,)
+            )
+            old_sessions = self.cursor.fetchall()
+            
+            if old_sessions:
+                self.cursor.execute(
+                    _SQL_DELETE_EXPIRED_SESSIONS,
+                    (cutoff,)
+                )
+        
+        return old_sessions
     
     @tasks.loop(minutes=5.0)
     async def cleanup_old_sessions(self) -> None:
         """Background task to clean up inactive game sessions."""
         try:
-            # Get current time
-            now = datetime.now()
+            # Sessions last active before this epoch second have timed out
+            cutoff = int(time.time()) - config.GAME_TIMEOUT
             
-            # Find sessions that have been inactive for too long
-            self.cursor.execute(
-                "SELECT session_id, user_id, game_id FROM active_sessions WHERE strftime('%s', ?) - strftime('%s', last_activity) > ?",
-                (now, config.GAME_TIMEOUT)
-            )
-            old_sessions = self.cursor.fetchall()
+            # Find and remove expired sessions with a single range DELETE
+            old_sessions = await self._run(self._delete_expired_sessions, cutoff)
             
-            for session in old_sessions:
-                logger.info(f"Cleaning up inactive session: {session['session_id']} for user {session['user_id']}")
+            users = []
+            for session_id, user_id, _ in old_sessions:
+                logger.info(f"Cleaning up inactive session: {session_id} for user {user_id}")
                 
-                # End the session
-                self.end_session(session['session_id'])
-                
-                # Try to notify the user if possible
-                user = self.bot.get_user(session['user_id'])
+                user = self.bot.get_user(user_id)
                 if user:
-                    try:
-                        await user.send("Your game session has expired due to inactivity. You can start a new game anytime!")
-                    except discord.errors.Forbidden:
-                        # Can't send DM to this user
-                        pass
+                    users.append(user)
+            
+            # Try to notify the users concurrently
+            results = await asyncio.gather(
+                *(user.send("Your game session has expired due to inactivity. You can start a new game anytime!") for user in users),
+                return_exceptions=True
+            )
+            for result in results:
+                # Forbidden means we can't send DMs to this user
+                if isinstance(result, Exception) and not isinstance(result, discord.errors.Forbidden):
+                    logger.error(f"Error notifying user of expired session: {result}")
         
         except Exception as e:
             logger.error(f"Error in cleanup_old_sessions task: {e}")
@@ -527,7 +811,8 @@ class Database(commands.Cog):
         
         # Close the database connection
         if self.connection:
-            self.connection.close()
+            with self._lock:
+                self.connection.close()
             logger.info("Database connection closed")
 
 async def setup(bot: commands.Bot) -> None:
@@ -19,9 +19,41 @@ import config
 # Set up logging
 logger = logging.getLogger("discord_bot.feedback")
 
+# Rating for the first byte of the rating input: digits are clamped to 1-5 and
+# anything else falls back to 3
+_RATING_LUT = bytearray(b'\x03' * 256)
+for _digit in b'0123456789':
+    _RATING_LUT[_digit] = max(1, min(5, _digit - 0x30))
+_RATING_LUT = bytes(_RATING_LUT)
+del _digit
+
+# Guild channels where the feedback command may be used (DMs are always allowed)
+_ALLOWED_CHANNELS = frozenset({config.V1SIM_CHANNEL_ID})
+
 class FeedbackModal(ui.Modal):
     """Modal for collecting user feedback."""
     
+    # Attribute name and TextInput arguments for each field, in display order
+    _FIELDS = (
+        # Rating input (text input)
+        ('rating', {
+            'label': "Rating (1-5)",
+            'placeholder': "Enter a number from 1 to 5 (1=Poor, 5=Excellent)",
+            'required': True,
+            'min_length': 1,
+            'max_length': 1,
+            'default': "5"
+        }),
+        # Comments input (text area)
+        ('comments', {
+            'label': "Comments (optional)",
+            'placeholder': "Share your thoughts about the game...",
+            'required': False,
+            'style': discord.TextStyle.paragraph,
+            'max_length': 500
+        })
+    )
+    
     def __init__(self, session_id: str, game_manager_cog):
         """Initialize the FeedbackModal.
         
@@ -33,26 +65,11 @@ class FeedbackModal(ui.Modal):
         self.session_id = session_id
         self.game_manager_cog = game_manager_cog
         
-        # Add rating input (text input)
-        self.rating = ui.TextInput(
-            label="Rating (1-5)",
-            placeholder="Enter a number from 1 to 5 (1=Poor, 5=Excellent)",
-            required=True,
-            min_length=1,
-            max_length=1,
-            default="5"
-        )
-        self.add_item(self.rating)
-        
-        # Add comments input (text area)
-        self.comments = ui.TextInput(
-            label="Comments (optional)",
-            placeholder="Share your thoughts about the game...",
-            required=False,
-            style=discord.TextStyle.paragraph,
-            max_length=500
-        )
-        self.add_item(self.comments)
+        # Each modal needs its own inputs, since they hold the submitted values
+        for name, kwargs in self._FIELDS:
+            text_input = ui.TextInput(**kwargs)
+            setattr(self, name, text_input)
+            self.add_item(text_input)
     
     async def on_submit(self, interaction: discord.Interaction):
         """Handle modal submission.
@@ -60,13 +77,9 @@ class FeedbackModal(ui.Modal):
         Args:
             interaction: The Discord interaction
         """
-        # Get rating value
-        try:
-            rating_value = int(self.rating.value)
-            # Ensure rating is between 1 and 5
-            rating_value = max(1, min(5, rating_value))
-        except (ValueError, TypeError):
-            rating_value = 3  # Default to 3 if invalid input
+        # Get rating value (the input is limited to one character)
+        value = self.rating.value
+        rating_value = _RATING_LUT[value.encode()[0]] if value else 3
         
         # Get comments
         comments_value = self.comments.value if self.comments.value else None
@@ -126,7 +139,7 @@ class Feedback(commands.Cog):
         """
         self.bot = bot
     
-    async def get_game_manager_cog(self):
+    def get_game_manager_cog(self):
         """Get the GameManager cog.
         
         Returns:
@@ -134,17 +147,19 @@ class Feedback(commands.Cog):
         """
         return self.bot.get_cog('GameManager')
     
-    async def create_feedback_view(self, session_id: str) -> FeedbackView:
+    def create_feedback_view(self, session_id: str) -> FeedbackView:
         """Create a feedback view for a game session.
         
+        A new view is built for every message: discord.py tracks each sent view
+        against its message, so one instance can't be attached to two messages.
+        
         Args:
             session_id: The game session ID
             
         Returns:
             The FeedbackView
         """
-        game_manager = await self.get_game_manager_cog()
-        return FeedbackView(session_id, game_manager)
+        return FeedbackView(session_id, self.get_game_manager_cog())
     
     @commands.hybrid_command(name="feedback", description="Provide feedback on your last game")
     async def feedback_command(self, ctx: commands.Context):
@@ -154,25 +169,24 @@ class Feedback(commands.Cog):
             ctx: The command context
         """
         # Check if command is used in the correct channel
-        if ctx.channel.id != config.V1SIM_CHANNEL_ID and not isinstance(ctx.channel, discord.DMChannel):
+        if ctx.channel.id not in _ALLOWED_CHANNELS and type(ctx.channel) is not discord.DMChannel:
             await ctx.send("This command can only be used in the designated game channel or DMs.", ephemeral=True)
             return
         
         # Get game manager cog
-        game_manager = await self.get_game_manager_cog()
+        game_manager = self.get_game_manager_cog()
         if not game_manager:
             await ctx.send("Sorry, the feedback system is currently unavailable.", ephemeral=True)
             return
         
         # Get user's active session
-        session = await game_manager.get_user_session(ctx.author.id)
+        session = game_manager.get_user_session(ctx.author.id)
         if not session:
             await ctx.send("You don't have an active game session. Start a new game first!", ephemeral=True)
             return
         
-        # Create and send feedback modal
-        modal = FeedbackModal(session.id, game_manager)
-        await ctx.send("Please provide your feedback:", view=FeedbackView(session.id, game_manager), ephemeral=True)
+        # Send the feedback button; it opens the modal when clicked
+        await ctx.send("Please provide your feedback:", view=self.create_feedback_view(session.id), ephemeral=True)
 
 async def setup(bot: commands.Bot) -> None:
     """Set up the Feedback cog."""
@@ -8,10 +8,12 @@ This cog handles the game session management and game logic, including:
 - Generating game analysis
 """
 
-import uuid
+import time
 import logging
 import asyncio
-from datetime import datetime
+import secrets
+import itertools
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple, Union
 
 import discord
@@ -23,9 +25,23 @@ from cogs.character_loader import Character
 # Set up logging
 logger = logging.getLogger("discord_bot.game_manager")
 
+# Session IDs are a per-process random prefix plus a counter, so they stay
+# unique across restarts without generating a UUID for every game
+_PROCESS_NONCE = secrets.token_hex(4)
+_SESSION_COUNTER = itertools.count(1)
+
+# Maximum number of expired sessions ended at the same time during cleanup
+_CLEANUP_CONCURRENCY = 8
+
 class GameSession:
     """Class representing an active game session."""
     
+    __slots__ = (
+        'id', 'user_id', 'character', 'game_id', 'channel_id', 'current_decision',
+        'total_score', 'decisions_made', 'last_activity', 'message_id', 'lock',
+        '_total_decisions'
+    )
+    
     def __init__(self, user_id: int, character: Character, game_id: int, channel_id: int):
         """Initialize a GameSession object.
         
@@ -35,16 +51,19 @@ class GameSession:
             game_id: The database game ID
             channel_id: The Discord channel ID
         """
-        self.id = str(uuid.uuid4())
+        self.id = f"{_PROCESS_NONCE}-{next(_SESSION_COUNTER)}"
         self.user_id = user_id
         self.character = character
         self.game_id = game_id
         self.channel_id = channel_id
         self.current_decision = 1
         self.total_score = 0
-        self.decisions_made: Dict[int, str] = {}  # Decision number -> choice
-        self.last_activity = datetime.now()
+        self._total_decisions = character.get_total_decisions()
+        # Choice letter per decision (index = decision number - 1), 0 if not made yet
+        self.decisions_made = bytearray(self._total_decisions)
+        self.last_activity = time.monotonic()
         self.message_id: Optional[int] = None  # ID of the last decision message
+        self.lock = asyncio.Lock()  # Serializes the player's decision clicks
     
     def make_decision(self, decision_number: int, choice: str) -> int:
         """Record a decision made by the player.
@@ -65,14 +84,14 @@ class GameSession:
         score = self.character.get_choice_score(decision_number, choice)
         
         # Record decision
-        self.decisions_made[decision_number] = choice
+        self.decisions_made[decision_number - 1] = ord(choice)
         self.total_score += score
         
         # Move to next decision
         self.current_decision += 1
         
         # Update last activity
-        self.last_activity = datetime.now()
+        self.last_activity = time.monotonic()
         
         return score
     
@@ -82,7 +101,7 @@ class GameSession:
         Returns:
             True if all decisions have been made, False otherwise
         """
-        return self.current_decision > self.character.get_total_decisions()
+        return self.current_decision > self._total_decisions
     
     def get_max_possible_score(self) -> int:
         """Calculate the maximum possible score for this character.
@@ -90,17 +109,7 @@ class GameSession:
         Returns:
             The maximum possible score
         """
-        max_score = 0
-        for i in range(1, self.character.get_total_decisions() + 1):
-            decision = self.character.get_decision(i)
-            if decision and 'choices' in decision:
-                # Find the highest scoring choice
-                highest_score = 0
-                for choice_id, choice_data in decision['choices'].items():
-                    if 'score' in choice_data and choice_data['score'] > highest_score:
-                        highest_score = choice_data['score']
-                max_score += highest_score
-        return max_score
+        return self.character.get_max_score()
     
     def get_score_percentage(self) -> float:
         """Calculate the score percentage.
@@ -108,7 +117,7 @@ class GameSession:
         Returns:
             The score percentage (0-100)
         """
-        max_score = self.get_max_possible_score()
+        max_score = self.character.get_max_score()
         if max_score == 0:
             return 0
         return (self.total_score / max_score) * 100
@@ -119,33 +128,27 @@ class GameSession:
         Returns:
             Analysis data dictionary
         """
-        score_percentage = self.get_score_percentage()
+        max_score = self.character.get_max_score()
+        score_percentage = (self.total_score / max_score) * 100 if max_score > 0 else 0
         analysis_template = self.character.get_analysis(score_percentage)
         
         # Count correct decisions
-        correct_decisions = 0
-        for decision_num, choice in self.decisions_made.items():
-            if self.character.is_correct_choice(decision_num, choice):
-                correct_decisions += 1
+        correct_decisions = self.character.count_correct_choices(self.decisions_made)
         
         # Calculate accuracy
-        total_decisions = self.character.get_total_decisions()
+        total_decisions = self._total_decisions
         accuracy = (correct_decisions / total_decisions) * 100 if total_decisions > 0 else 0
         
         return {
             'text': analysis_template.get('text', ''),
             'principles': analysis_template.get('principles', []),
             'score': self.total_score,
-            'max_score': self.get_max_possible_score(),
+            'max_score': max_score,
             'percentage': score_percentage,
             'correct_decisions': correct_decisions,
             'total_decisions': total_decisions,
             'accuracy': accuracy
         }
-    
-    def update_activity(self) -> None:
-        """Update the last activity timestamp."""
-        self.last_activity = datetime.now()
 
 class GameManager(commands.Cog):
     """Cog for managing game sessions and game logic."""
@@ -157,27 +160,36 @@ class GameManager(commands.Cog):
             bot: The Discord bot instance
         """
         self.bot = bot
-        self.active_sessions: Dict[str, GameSession] = {}
-        self.user_sessions: Dict[int, str] = {}  # user_id -> session_id
+        # Ordered from least to most recently active, so the next session to
+        # expire is always at the front
+        self.active_sessions: 'OrderedDict[str, GameSession]' = OrderedDict()
+        self.user_to_session: Dict[int, GameSession] = {}  # user_id -> session
+        
+        # Cog references, resolved lazily since other cogs may load after this one
+        self._database = None
+        self._character_loader = None
+        
+        # Decision writes are queued and flushed in batches off the interaction path
+        self._db_queue: asyncio.Queue = asyncio.Queue()
+        self._flush_lock = asyncio.Lock()
         
-        # Start background task to clean up old sessions
+        # Start background tasks to flush queued writes and clean up old sessions
+        self.flush_db_writes.start()
         self.cleanup_old_sessions.start()
     
-    async def get_database_cog(self):
-        """Get the Database cog.
-        
-        Returns:
-            The Database cog
-        """
-        return self.bot.get_cog('Database')
+    @property
+    def database_cog(self):
+        """The Database cog, looked up once it has been loaded."""
+        if self._database is None:
+            self._database = self.bot.get_cog('Database')
+        return self._database
     
-    async def get_character_loader_cog(self):
-        """Get the CharacterLoader cog.
-        
-        Returns:
-            The CharacterLoader cog
-        """
-        return self.bot.get_cog('CharacterLoader')
+    @property
+    def character_loader_cog(self):
+        """The CharacterLoader cog, looked up once it has been loaded."""
+        if self._character_loader is None:
+            self._character_loader = self.bot.get_cog('CharacterLoader')
+        return self._character_loader
     
     async def create_game_session(self, user_id: int, character_id: str, channel_id: int) -> Optional[GameSession]:
         """Create a new game session.
@@ -191,7 +203,7 @@ class GameManager(commands.Cog):
             The GameSession object or None if creation failed
         """
         # Get character loader cog
-        character_loader = await self.get_character_loader_cog()
+        character_loader = self.character_loader_cog
         if not character_loader:
             logger.error("CharacterLoader cog not found")
             return None
@@ -203,7 +215,7 @@ class GameManager(commands.Cog):
             return None
         
         # Get database cog
-        database = await self.get_database_cog()
+        database = self.database_cog
         if not database:
             logger.error("Database cog not found")
             return None
@@ -211,10 +223,10 @@ class GameManager(commands.Cog):
         # Get or create user
         user = self.bot.get_user(user_id)
         username = user.name if user else "Unknown"
-        database.get_or_create_user(user_id, username)
+        await database.get_or_create_user(user_id, username)
         
         # Create game in database
-        game_id = database.create_game(user_id, character_id)
+        game_id = await database.create_game(user_id, character_id)
         
         # Create game session
         session = GameSession(user_id, character, game_id, channel_id)
@@ -223,22 +235,21 @@ class GameManager(commands.Cog):
         self.active_sessions[session.id] = session
         
         # If user already has a session, end it
-        if user_id in self.user_sessions:
-            old_session_id = self.user_sessions[user_id]
-            if old_session_id in self.active_sessions:
-                await self.end_game_session(old_session_id, completed=False)
+        old_session = self.user_to_session.pop(user_id, None)
+        if old_session is not None:
+            await self.end_game_session(old_session.id, completed=False)
         
         # Associate user with session
-        self.user_sessions[user_id] = session.id
+        self.user_to_session[user_id] = session
         
         # Create session in database
-        database.create_session(session.id, user_id, game_id, channel_id)
+        await database.create_session(session.id, user_id, game_id, channel_id)
         
         logger.info(f"Created game session: {session.id} for user {user_id} with character {character_id}")
         
         return session
     
-    async def get_user_session(self, user_id: int) -> Optional[GameSession]:
+    def get_user_session(self, user_id: int) -> Optional[GameSession]:
         """Get the active game session for a user.
         
         Args:
@@ -247,16 +258,7 @@ class GameManager(commands.Cog):
         Returns:
             The GameSession object or None if not found
         """
-        if user_id not in self.user_sessions:
-            return None
-        
-        session_id = self.user_sessions[user_id]
-        if session_id not in self.active_sessions:
-            # Session ID exists but session doesn't - clean up
-            del self.user_sessions[user_id]
-            return None
-        
-        return self.active_sessions[session_id]
+        return self.user_to_session.get(user_id)
     
     async def make_decision(self, session_id: str, choice: str) -> Tuple[int, bool]:
         """Process a decision made by the player.
@@ -268,37 +270,26 @@ class GameManager(commands.Cog):
         Returns:
             Tuple of (score, is_completed)
         """
-        if session_id not in self.active_sessions:
+        session = self.active_sessions.get(session_id)
+        if session is None:
             logger.error(f"Session not found: {session_id}")
             return (0, False)
         
-        session = self.active_sessions[session_id]
-        
-        # Get database cog
-        database = await self.get_database_cog()
-        if not database:
-            logger.error("Database cog not found")
-            return (0, False)
-        
         # Make decision
         score = session.make_decision(session.current_decision, choice)
+        self.active_sessions.move_to_end(session_id)
         
-        # Record decision in database
-        database.record_decision(
-            session.game_id, 
-            session.current_decision - 1, 
-            choice, 
-            score
-        )
-        
-        # Update session activity
-        database.update_session_activity(session_id)
+        # Queue the decision record and session activity update for the next flush
+        self._db_queue.put_nowait((
+            'decision',
+            (session.game_id, session.current_decision - 1, choice, score, session_id)
+        ))
         
         # Check if game is completed
         is_completed = session.is_completed()
         if is_completed:
-            # Complete game in database
-            database.complete_game(session.game_id)
+            # Complete game in database once its decisions are written
+            self._db_queue.put_nowait(('complete', (session.game_id,)))
         
         return (score, is_completed)
     
@@ -309,28 +300,30 @@ class GameManager(commands.Cog):
             session_id: The session ID
             completed: Whether the game was completed normally
         """
-        if session_id not in self.active_sessions:
+        session = self.active_sessions.get(session_id)
+        if session is None:
             logger.error(f"Session not found: {session_id}")
             return
         
-        session = self.active_sessions[session_id]
-        
         # Get database cog
-        database = await self.get_database_cog()
+        database = self.database_cog
         if not database:
             logger.error("Database cog not found")
             return
         
+        # Write any queued decisions for this game before changing its state
+        await self._flush_db_writes()
+        
         # If game was completed, mark as completed in database
         if completed and not session.is_completed():
-            database.complete_game(session.game_id)
+            await database.complete_game(session.game_id)
         
         # Remove session from database
-        database.end_session(session_id)
+        await database.end_session(session_id)
         
         # Remove user association
-        if session.user_id in self.user_sessions and self.user_sessions[session.user_id] == session_id:
-            del self.user_sessions[session.user_id]
+        if self.user_to_session.get(session.user_id) is session:
+            del self.user_to_session[session.user_id]
         
         # Remove session
         del self.active_sessions[session_id]
@@ -348,67 +341,160 @@ class GameManager(commands.Cog):
         Returns:
             True if successful, False otherwise
         """
-        if session_id not in self.active_sessions:
+        session = self.active_sessions.get(session_id)
+        if session is None:
             logger.error(f"Session not found: {session_id}")
             return False
         
-        session = self.active_sessions[session_id]
-        
         # Get database cog
-        database = await self.get_database_cog()
+        database = self.database_cog
         if not database:
             logger.error("Database cog not found")
             return False
         
         # Record feedback
-        database.record_feedback(session.game_id, rating, comments)
+        await database.record_feedback(session.game_id, rating, comments)
         
         logger.info(f"Recorded feedback for session {session_id}: rating {rating}")
         
         return True
     
-    @tasks.loop(minutes=1.0)
+    async def _flush_db_writes(self) -> None:
+        """Write all queued decisions to the database in a single batch."""
+        async with self._flush_lock:
+            if self._db_queue.empty():
+                return
+            
+            # Get database cog
+            database = self.database_cog
+            if not database:
+                logger.error("Database cog not found")
+                return
+            
+            decisions = []
+            session_ids = []
+            completed_game_ids = []
+            while not self._db_queue.empty():
+                kind, args = self._db_queue.get_nowait()
+                if kind == 'decision':
+                    game_id, decision_number, choice, score, session_id = args
+                    decisions.append((game_id, decision_number, choice, score))
+                    session_ids.append(session_id)
+                elif kind == 'complete':
+                    completed_game_ids.append(args[0])
+            
+            try:
+                # Decisions precede their game's completion in the queue, so
+                # writing all decisions first keeps each game's total correct
+                if len(decisions) == 1:
+                    # The usual case: a single click since the last flush
+                    await database.record_decision_and_touch(*decisions[0], session_ids[0])
+                elif decisions:
+                    await database.record_decisions_bulk(decisions, session_ids)
+                for game_id in completed_game_ids:
+                    await database.complete_game(game_id)
+            except Exception as e:
+                logger.error(f"Error flushing queued database writes: {e}")
+    
+    @tasks.loop(seconds=0.1)
+    async def flush_db_writes(self) -> None:
+        """Background task to flush queued decision writes."""
+        await self._flush_db_writes()
+    
+    @flush_db_writes.before_loop
+    async def before_flush(self) -> None:
+        """Wait until the bot is ready before starting the flush task."""
+        await self.bot.wait_until_ready()
+    
+    async def _notify_timeout(self, user_id: int) -> None:
+        """Let a user know their game session expired.
+        
+        Args:
+            user_id: The Discord user ID
+        """
+        user = self.bot.get_user(user_id)
+        if user:
+            try:
+                await user.send("Your game session has expired due to inactivity. You can start a new game anytime!")
+            except discord.errors.Forbidden:
+                # Can't send DM to this user
+                pass
+    
+    @tasks.loop(seconds=0)
     async def cleanup_old_sessions(self) -> None:
-        """Background task to clean up inactive game sessions."""
+        """Background task to clean up inactive game sessions.
+        
+        Sleeps until the least recently active session is due to expire rather
+        than polling on a fixed interval.
+        """
         try:
+            timeout = config.GAME_TIMEOUT
+            
             # Get current time
-            now = datetime.now()
+            now = time.monotonic()
             
-            # Find sessions that have been inactive for too long
+            # Pop expired sessions from the front, stopping at the first live one
             sessions_to_remove = []
+            next_expiry = now + timeout
             for session_id, session in self.active_sessions.items():
-                time_diff = (now - session.last_activity).total_seconds()
-                if time_diff > config.GAME_TIMEOUT:
-                    sessions_to_remove.append(session_id)
+                expiry = session.last_activity + timeout
+                if expiry > now:
+                    next_expiry = expiry
+                    break
+                sessions_to_remove.append(session_id)
             
-            # End each inactive session
+            # Remember who to notify before the sessions are removed; finished
+            # games have already shown their results, so they aren't told they timed out
+            user_ids = []
             for session_id in sessions_to_remove:
                 logger.info(f"Cleaning up inactive session: {session_id}")
-                await self.end_game_session(session_id, completed=False)
-                
-                # Try to notify the user if possible
-                if session_id in self.active_sessions:  # Double-check it still exists
-                    session = self.active_sessions[session_id]
-                    user = self.bot.get_user(session.user_id)
-                    if user:
-                        try:
-                            await user.send("Your game session has expired due to inactivity. You can start a new game anytime!")
-                        except discord.errors.Forbidden:
-                            # Can't send DM to this user
-                            pass
+                session = self.active_sessions[session_id]
+                if not session.is_completed():
+                    user_ids.append(session.user_id)
+            
+            # End inactive sessions concurrently, a few at a time
+            semaphore = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
+            
+            async def end_session(session_id: str) -> None:
+                async with semaphore:
+                    await self.end_game_session(session_id, completed=False)
+            
+            results = await asyncio.gather(
+                *(end_session(session_id) for session_id in sessions_to_remove),
+                return_exceptions=True
+            )
+            for session_id, result in zip(sessions_to_remove, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error ending inactive session {session_id}: {result}")
+            
+            # Notify all affected users in parallel
+            if user_ids:
+                await asyncio.gather(
+                    *(self._notify_timeout(user_id) for user_id in user_ids),
+                    return_exceptions=True
+                )
         
         except Exception as e:
             logger.error(f"Error in cleanup_old_sessions task: {e}")
+            next_expiry = time.monotonic() + 60
+        
+        # Sessions only move later in the order, so nothing can expire before
+        # the current head does
+        await asyncio.sleep(max(next_expiry - time.monotonic(), 0))
     
     @cleanup_old_sessions.before_loop
     async def before_cleanup(self) -> None:
         """Wait until the bot is ready before starting the cleanup task."""
         await self.bot.wait_until_ready()
     
-    def cog_unload(self) -> None:
+    async def cog_unload(self) -> None:
         """Clean up when the cog is unloaded."""
-        # Stop the background task
+        # Stop the background tasks
+        self.flush_db_writes.cancel()
         self.cleanup_old_sessions.cancel()
+        
+        # Don't lose decisions that haven't been written yet
+        await self._flush_db_writes()
 
 async def setup(bot: commands.Bot) -> None:
     """Set up the GameManager cog."""
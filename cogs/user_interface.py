@@ -23,9 +23,81 @@ from cogs.character_loader import Character
 # Set up logging
 logger = logging.getLogger("discord_bot.user_interface")
 
+# Embed colour, converted once instead of on every embed
+_EMBED_COLOR = discord.Colour(config.EMBED_COLOR)
+
+# Strong references to scheduled tasks so they aren't garbage collected early
+_background_tasks = set()
+
+def _build_help_embed() -> Dict[str, Any]:
+    """Build the help embed.
+    
+    Returns:
+        The help embed as a dict, for Embed.from_dict
+    """
+    embed = discord.Embed(
+        title="Financial Simulation Game - Help",
+        description="Welcome to the Financial Simulation Game! Here's how to play:",
+        color=_EMBED_COLOR
+    )
+    
+    # Add command information
+    commands_text = (
+        "• `/play` - Start a new game\n"
+        "• `/play [character]` - Start a game with a specific character\n"
+        "• `/stats` - View your game statistics\n"
+        "• `/stats [user]` - View another user's statistics\n"
+        "• `/leaderboard` - View the global leaderboard\n"
+        "• `/leaderboard [character]` - View the leaderboard for a specific character\n"
+        "• `/feedback` - Provide feedback on your current game\n"
+        "• `/help` - Show this help information"
+    )
+    embed.add_field(name="Commands", value=commands_text, inline=False)
+    
+    # Add gameplay information
+    gameplay_text = (
+        "1. Select a character to play as\n"
+        "2. Make decisions at key moments in their career\n"
+        "3. Earn points based on your choices\n"
+        "4. Complete all decisions to finish the game\n"
+        "5. Provide feedback to help improve the game"
+    )
+    embed.add_field(name="How to Play", value=gameplay_text, inline=False)
+    
+    # Add note about channel restriction
+    embed.set_footer(text=f"Note: This game can only be played in the designated channel.")
+    
+    return embed.to_dict()
+
+_HELP_EMBED_DICT = _build_help_embed()
+
+def in_sim_channel(allow_dm: bool = False):
+    """Restrict a command to the game channel, and optionally DMs.
+    
+    Args:
+        allow_dm: Whether the command may also be used in DMs
+        
+    Returns:
+        The command check decorator
+    """
+    channel_id = config.V1SIM_CHANNEL_ID
+    if allow_dm:
+        message = f"This command can only be used in <#{channel_id}> or DMs."
+    else:
+        message = f"This game is only available in <#{channel_id}>."
+    
+    async def predicate(ctx: commands.Context) -> bool:
+        if ctx.channel.id == channel_id or (allow_dm and type(ctx.channel) is discord.DMChannel):
+            return True
+        raise commands.CheckFailure(message)
+    
+    return commands.check(predicate)
+
 class CharacterSelectView(ui.View):
     """View for character selection."""
     
+    __slots__ = ('characters', 'user_id', 'game_manager_cog', 'channel_id', 'message')
+    
     def __init__(self, characters: List[Dict[str, Any]], user_id: int, game_manager_cog, channel_id: int):
         """Initialize the CharacterSelectView.
         
@@ -40,6 +112,7 @@ class CharacterSelectView(ui.View):
         self.user_id = user_id
         self.game_manager_cog = game_manager_cog
         self.channel_id = channel_id
+        self.message: Optional[discord.Message] = None  # Set once the view is sent
         
         # Add character select dropdown
         self.add_item(CharacterDropdown(characters))
@@ -51,11 +124,11 @@ class CharacterSelectView(ui.View):
             item.disabled = True
         
         # Try to edit the message
-        try:
-            if hasattr(self, 'message') and self.message:
+        if self.message is not None:
+            try:
                 await self.message.edit(view=self)
-        except:
-            pass
+            except discord.HTTPException:
+                pass
 
 class CharacterDropdown(ui.Select):
     """Dropdown for character selection."""
@@ -115,110 +188,95 @@ class CharacterDropdown(ui.Select):
             await interaction.followup.send("Failed to create game session. Please try again.")
             return
         
-        # Get character loader cog
-        character_loader = interaction.client.get_cog('CharacterLoader')
-        if not character_loader:
-            await interaction.followup.send("Failed to load character data. Please try again.")
-            return
-        
-        # Get character
-        character = character_loader.get_character(character_id)
-        if not character:
-            await interaction.followup.send("Failed to load character data. Please try again.")
-            return
-        
-        # Create character intro embed
-        embed = discord.Embed(
-            title=f"Playing as {character.name}",
-            description=f"**{character.title}**\n\nStarting Year: {character.starting_year}\nInitial Capital: ${character.initial_capital:,}",
-            color=config.EMBED_COLOR
-        )
-        
-        # Add key principles
-        if character.key_principles:
-            principles = "\n".join([f"• {principle}" for principle in character.key_principles])
-            embed.add_field(name="Key Principles", value=principles, inline=False)
+        # The session already holds the selected character
+        character = session.character
         
-        # Add game info
-        embed.add_field(
-            name="Game Information",
-            value=f"You'll face {character.get_total_decisions()} key decisions that shaped {character.name}'s career.\nMake your choices wisely!",
-            inline=False
+        # Start the game with the character intro and first decision in one message
+        await send_decision(
+            interaction.client, session, 1,
+            intro_embed=character.get_intro_embed()
         )
-        
-        # Send character intro
-        await interaction.followup.send(embed=embed)
-        
-        # Start the game with the first decision
-        await send_decision(interaction.client, session, 1)
 
-class DecisionView(ui.View):
-    """View for decision choices."""
+class ChoiceButton(ui.DynamicItem[ui.Button], template=r'choice:(?P<session_id>[^:]+):(?P<decision_number>\d+):(?P<choice_id>[^:]+)'):
+    """Button for one choice in a decision.
     
-    def __init__(self, session_id: str, decision_number: int, choices: Dict[str, Dict[str, Any]], game_manager_cog):
-        """Initialize the DecisionView.
+    The session, decision and choice are encoded in the custom ID, so the
+    button works without a live view object behind the message.
+    """
+    
+    __slots__ = ('session_id', 'decision_number', 'choice_id')
+    
+    def __init__(self, session_id: str, decision_number: int, choice_id: str):
+        """Initialize the ChoiceButton.
         
         Args:
             session_id: The game session ID
             decision_number: The decision number
-            choices: Dictionary of choices
-            game_manager_cog: The GameManager cog
+            choice_id: The choice ID (e.g., 'a', 'b', 'c')
         """
-        super().__init__(timeout=300)  # 5 minute timeout
-        self.session_id = session_id
-        self.decision_number = decision_number
-        self.choices = choices
-        self.game_manager_cog = game_manager_cog
-        
-        # Add buttons for each choice
-        for choice_id, choice_data in choices.items():
-            button = ui.Button(
+        super().__init__(
+            ui.Button(
                 label=f"Option {choice_id.upper()}",
                 style=discord.ButtonStyle.primary,
-                custom_id=f"choice_{choice_id}"
+                custom_id=f"choice:{session_id}:{decision_number}:{choice_id}"
             )
-            button.callback = self.create_callback(choice_id)
-            self.add_item(button)
+        )
+        self.session_id = session_id
+        self.decision_number = decision_number
+        self.choice_id = choice_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        """Recreate the button from a clicked component's custom ID."""
+        return cls(match['session_id'], int(match['decision_number']), match['choice_id'])
     
-    def create_callback(self, choice_id: str):
-        """Create a callback for a choice button.
+    async def callback(self, interaction: discord.Interaction):
+        """Handle a click on the button.
         
         Args:
-            choice_id: The choice ID
-            
-        Returns:
-            The callback function
+            interaction: The Discord interaction
         """
-        async def callback(interaction: discord.Interaction):
-            # Get the session
-            session = self.game_manager_cog.active_sessions.get(self.session_id)
-            if not session:
-                await interaction.response.send_message("Game session not found. Please start a new game.", ephemeral=True)
-                return
-            
-            # Check if the user is the one who initiated the game
-            if interaction.user.id != session.user_id:
-                await interaction.response.send_message("This isn't your game session!", ephemeral=True)
+        choice_id = self.choice_id
+        game_manager = interaction.client.get_cog('GameManager')
+        
+        # Get the session
+        session = game_manager.active_sessions.get(self.session_id) if game_manager else None
+        if not session:
+            await interaction.response.send_message("Game session not found. Please start a new game.", ephemeral=True)
+            return
+        
+        # Check if the user is the one who initiated the game
+        if interaction.user.id != session.user_id:
+            await interaction.response.send_message("This isn't your game session!", ephemeral=True)
+            return
+        
+        # Handle this user's clicks one at a time
+        async with session.lock:
+            # Ignore clicks on a decision that has already been made
+            if session.current_decision != self.decision_number:
+                await interaction.response.send_message("You've already made this decision.", ephemeral=True)
                 return
             
             # Disable all buttons
-            for item in self.children:
+            for item in self.view.children:
                 item.disabled = True
             
-            # Update the message
-            await interaction.response.edit_message(view=self)
+            # Stop the view rebuilt from the message so discord.py doesn't keep it in its view store
+            self.view.stop()
+            await interaction.response.edit_message(view=self.view)
             
             # Process the decision
-            score, is_completed = await self.game_manager_cog.make_decision(self.session_id, choice_id)
+            score, is_completed = await game_manager.make_decision(self.session_id, choice_id)
             
             # Get the choice data
-            choice_data = self.choices.get(choice_id, {})
+            decision = session.character.get_decision(self.decision_number)
+            choice_data = decision['choices'].get(choice_id, {})
             
             # Create outcome embed
             embed = discord.Embed(
                 title=f"Decision {self.decision_number} Outcome",
                 description=f"You chose: **Option {choice_id.upper()}**\n\n{choice_data.get('text', 'No description')}",
-                color=config.EMBED_COLOR
+                color=_EMBED_COLOR
             )
             
             # Add outcome
@@ -233,35 +291,40 @@ class DecisionView(ui.View):
                 embed.add_field(name="V1 Lesson", value=choice_data['V1Lesson'], inline=False)
             
             # Add historical context if available
-            decision = session.character.get_decision(self.decision_number)
-            if decision and 'historical_context' in decision:
+            if 'historical_context' in decision:
                 embed.add_field(name="Historical Context", value=decision['historical_context'], inline=False)
             
             # Send outcome
             await interaction.followup.send(embed=embed)
-            
-            # If game is completed, show final results
-            if is_completed:
-                await show_game_results(interaction.client, session)
-            else:
-                # Send next decision after a short delay
-                await asyncio.sleep(2)
-                await send_decision(interaction.client, session, self.decision_number + 1)
         
-        return callback
+        # If game is completed, show final results
+        if is_completed:
+            await show_game_results(interaction.client, session)
+        else:
+            # Send next decision after a short delay without holding up this callback
+            task = asyncio.create_task(send_decision_later(
+                interaction.client, session, self.decision_number + 1, 2
+            ))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+class DecisionView(ui.View):
+    """View for decision choices."""
     
-    async def on_timeout(self):
-        """Handle view timeout."""
-        # Disable all items
-        for item in self.children:
-            item.disabled = True
+    def __init__(self, session, decision_number: int):
+        """Initialize the DecisionView.
         
-        # Try to edit the message
-        try:
-            if hasattr(self, 'message') and self.message:
-                await self.message.edit(view=self)
-        except:
-            pass
+        Args:
+            session: The GameSession object
+            decision_number: The decision number
+        """
+        # Buttons are handled through ChoiceButton's custom ID, so the view
+        # isn't kept in memory after the message is sent
+        super().__init__(timeout=None)
+        
+        # Add buttons for each choice; the choice data itself stays on the Character
+        for choice_id in session.character.get_decision(decision_number)['choices']:
+            self.add_item(ChoiceButton(session.id, decision_number, choice_id))
 
 class UserInterface(commands.Cog):
     """Cog for handling user interface and commands."""
@@ -273,33 +336,36 @@ class UserInterface(commands.Cog):
             bot: The Discord bot instance
         """
         self.bot = bot
-    
-    async def get_game_manager_cog(self):
-        """Get the GameManager cog.
         
-        Returns:
-            The GameManager cog
-        """
-        return self.bot.get_cog('GameManager')
-    
-    async def get_character_loader_cog(self):
-        """Get the CharacterLoader cog.
-        
-        Returns:
-            The CharacterLoader cog
-        """
-        return self.bot.get_cog('CharacterLoader')
-    
-    async def get_database_cog(self):
-        """Get the Database cog.
-        
-        Returns:
-            The Database cog
-        """
-        return self.bot.get_cog('Database')
+        # Cog references, resolved lazily in case a cog loads after this one
+        self._game_manager = None
+        self._character_loader = None
+        self._database = None
+    
+    @property
+    def game_manager_cog(self):
+        """The GameManager cog, looked up once it has been loaded."""
+        if self._game_manager is None:
+            self._game_manager = self.bot.get_cog('GameManager')
+        return self._game_manager
+    
+    @property
+    def character_loader_cog(self):
+        """The CharacterLoader cog, looked up once it has been loaded."""
+        if self._character_loader is None:
+            self._character_loader = self.bot.get_cog('CharacterLoader')
+        return self._character_loader
+    
+    @property
+    def database_cog(self):
+        """The Database cog, looked up once it has been loaded."""
+        if self._database is None:
+            self._database = self.bot.get_cog('Database')
+        return self._database
     
     @commands.hybrid_command(name="play", description="Start a new financial simulation game")
     @app_commands.describe(character="Optional character to play as")
+    @in_sim_channel()
     async def play_command(self, ctx: commands.Context, character: Optional[str] = None):
         """Command to start a new game.
         
@@ -307,25 +373,20 @@ class UserInterface(commands.Cog):
             ctx: The command context
             character: Optional character ID to play as
         """
-        # Check if command is used in the correct channel
-        if ctx.channel.id != config.V1SIM_CHANNEL_ID:
-            await ctx.send(f"This game is only available in <#{config.V1SIM_CHANNEL_ID}>.", ephemeral=True)
-            return
-        
         # Get character loader cog
-        character_loader = await self.get_character_loader_cog()
+        character_loader = self.character_loader_cog
         if not character_loader:
             await ctx.send("Failed to load character data. Please try again later.", ephemeral=True)
             return
         
         # Get game manager cog
-        game_manager = await self.get_game_manager_cog()
+        game_manager = self.game_manager_cog
         if not game_manager:
             await ctx.send("Failed to start game. Please try again later.", ephemeral=True)
             return
         
         # Check if user already has an active session
-        existing_session = await game_manager.get_user_session(ctx.author.id)
+        existing_session = game_manager.get_user_session(ctx.author.id)
         if existing_session:
             # Ask if they want to end the current game
             confirm_view = ui.View(timeout=30)
@@ -397,30 +458,11 @@ class UserInterface(commands.Cog):
                 await ctx.send("Failed to create game session. Please try again.", ephemeral=True)
                 return
             
-            # Create character intro embed
-            embed = discord.Embed(
-                title=f"Playing as {character.name}",
-                description=f"**{character.title}**\n\nStarting Year: {character.starting_year}\nInitial Capital: ${character.initial_capital:,}",
-                color=config.EMBED_COLOR
-            )
-            
-            # Add key principles
-            if character.key_principles:
-                principles = "\n".join([f"• {principle}" for principle in character.key_principles])
-                embed.add_field(name="Key Principles", value=principles, inline=False)
-            
-            # Add game info
-            embed.add_field(
-                name="Game Information",
-                value=f"You'll face {character.get_total_decisions()} key decisions that shaped {character.name}'s career.\nMake your choices wisely!",
-                inline=False
+            # Start the game with the character intro and first decision in one message
+            await send_decision(
+                self.bot, session, 1,
+                intro_embed=character.get_intro_embed(), destination=ctx
             )
-            
-            # Send character intro
-            await ctx.send(embed=embed)
-            
-            # Start the game with the first decision
-            await send_decision(self.bot, session, 1)
         else:
             # Show character selection
             characters = character_loader.get_character_list()
@@ -429,7 +471,7 @@ class UserInterface(commands.Cog):
             embed = discord.Embed(
                 title="Financial Simulation Game",
                 description="Select a character to play as:",
-                color=config.EMBED_COLOR
+                color=_EMBED_COLOR
             )
             
             # Create view with character dropdown
@@ -443,6 +485,7 @@ class UserInterface(commands.Cog):
     
     @commands.hybrid_command(name="stats", description="View your game statistics")
     @app_commands.describe(user="User to view stats for (defaults to yourself)")
+    @in_sim_channel(allow_dm=True)
     async def stats_command(self, ctx: commands.Context, user: Optional[discord.Member] = None):
         """Command to view game statistics.
         
@@ -450,27 +493,22 @@ class UserInterface(commands.Cog):
             ctx: The command context
             user: Optional user to view stats for
         """
-        # Check if command is used in the correct channel
-        if ctx.channel.id != config.V1SIM_CHANNEL_ID and not isinstance(ctx.channel, discord.DMChannel):
-            await ctx.send(f"This command can only be used in <#{config.V1SIM_CHANNEL_ID}> or DMs.", ephemeral=True)
-            return
-        
         # Get target user
         target_user = user or ctx.author
         
         # Get database cog
-        database = await self.get_database_cog()
+        database = self.database_cog
         if not database:
             await ctx.send("Failed to load statistics. Please try again later.", ephemeral=True)
             return
         
         # Get user stats
-        stats = database.get_user_stats(target_user.id)
+        stats = await database.get_user_stats(target_user.id)
         
         # Create embed
         embed = discord.Embed(
             title=f"{target_user.display_name}'s Statistics",
-            color=config.EMBED_COLOR
+            color=_EMBED_COLOR
         )
         
         # Add stats
@@ -482,9 +520,10 @@ class UserInterface(commands.Cog):
         
         # Add recent games if available
         if stats['recent_games']:
-            recent_games_text = ""
-            for game in stats['recent_games']:
-                recent_games_text += f"• {game['character_id']}: {game['total_score']} points\n"
+            recent_games_text = "".join(
+                f"• {game['character_id']}: {game['total_score']} points\n"
+                for game in stats['recent_games']
+            )
             embed.add_field(name="Recent Games", value=recent_games_text, inline=False)
         
         # Add last played
@@ -495,6 +534,7 @@ class UserInterface(commands.Cog):
     
     @commands.hybrid_command(name="leaderboard", description="View the game leaderboard")
     @app_commands.describe(character="Optional character to filter by")
+    @in_sim_channel(allow_dm=True)
     async def leaderboard_command(self, ctx: commands.Context, character: Optional[str] = None):
         """Command to view the leaderboard.
         
@@ -502,13 +542,8 @@ class UserInterface(commands.Cog):
             ctx: The command context
             character: Optional character ID to filter by
         """
-        # Check if command is used in the correct channel
-        if ctx.channel.id != config.V1SIM_CHANNEL_ID and not isinstance(ctx.channel, discord.DMChannel):
-            await ctx.send(f"This command can only be used in <#{config.V1SIM_CHANNEL_ID}> or DMs.", ephemeral=True)
-            return
-        
         # Get database cog
-        database = await self.get_database_cog()
+        database = self.database_cog
         if not database:
             await ctx.send("Failed to load leaderboard. Please try again later.", ephemeral=True)
             return
@@ -516,27 +551,28 @@ class UserInterface(commands.Cog):
         # Get character loader cog if character filter is specified
         character_name = None
         if character:
-            character_loader = await self.get_character_loader_cog()
+            character_loader = self.character_loader_cog
             if character_loader:
                 char_obj = character_loader.get_character(character)
                 if char_obj:
                     character_name = char_obj.name
         
         # Get leaderboard
-        leaderboard = database.get_leaderboard(limit=10, character_id=character)
+        leaderboard = await database.get_leaderboard(limit=10, character_id=character)
         
         # Create embed
         embed = discord.Embed(
             title=f"Leaderboard{f' - {character_name}' if character_name else ''}",
             description="Top players by highest score",
-            color=config.EMBED_COLOR
+            color=_EMBED_COLOR
         )
         
         # Add leaderboard entries
         if leaderboard:
-            leaderboard_text = ""
-            for i, entry in enumerate(leaderboard, 1):
-                leaderboard_text += f"{i}. **{entry['username']}**: {entry['high_score']} points\n"
+            leaderboard_text = "".join(
+                f"{i}. **{entry['username']}**: {entry['high_score']} points\n"
+                for i, entry in enumerate(leaderboard, 1)
+            )
             embed.description = leaderboard_text
         else:
             embed.description = "No games have been completed yet. Be the first on the leaderboard!"
@@ -550,52 +586,34 @@ class UserInterface(commands.Cog):
         Args:
             ctx: The command context
         """
-        embed = discord.Embed(
-            title="Financial Simulation Game - Help",
-            description="Welcome to the Financial Simulation Game! Here's how to play:",
-            color=config.EMBED_COLOR
-        )
-        
-        # Add command information
-        commands_text = (
-            "• `/play` - Start a new game\n"
-            "• `/play [character]` - Start a game with a specific character\n"
-            "• `/stats` - View your game statistics\n"
-            "• `/stats [user]` - View another user's statistics\n"
-            "• `/leaderboard` - View the global leaderboard\n"
-            "• `/leaderboard [character]` - View the leaderboard for a specific character\n"
-            "• `/feedback` - Provide feedback on your current game\n"
-            "• `/help` - Show this help information"
-        )
-        embed.add_field(name="Commands", value=commands_text, inline=False)
-        
-        # Add gameplay information
-        gameplay_text = (
-            "1. Select a character to play as\n"
-            "2. Make decisions at key moments in their career\n"
-            "3. Earn points based on your choices\n"
-            "4. Complete all decisions to finish the game\n"
-            "5. Provide feedback to help improve the game"
-        )
-        embed.add_field(name="How to Play", value=gameplay_text, inline=False)
-        
-        # Add note about channel restriction
-        embed.set_footer(text=f"Note: This game can only be played in the designated channel.")
+        # The help content is static, so the embed is built once at import
+        await ctx.send(embed=discord.Embed.from_dict(_HELP_EMBED_DICT))
+    
+    async def cog_command_error(self, ctx: commands.Context, error: commands.CommandError):
+        """Tell the user why a command check rejected their command.
         
-        await ctx.send(embed=embed)
+        Args:
+            ctx: The command context
+            error: The error raised by the command
+        """
+        if isinstance(error, commands.CheckFailure):
+            await ctx.send(str(error), ephemeral=True)
     
     @commands.Cog.listener()
     async def on_ready(self):
         """Event triggered when the bot is ready."""
         logger.info("UserInterface cog is ready")
 
-async def send_decision(bot, session, decision_number: int):
+async def send_decision(bot, session, decision_number: int,
+                        intro_embed: Optional[discord.Embed] = None, destination=None):
     """Send a decision message to the user.
     
     Args:
         bot: The Discord bot
         session: The GameSession object
         decision_number: The decision number
+        intro_embed: Optional embed to show above the decision, e.g. the character intro
+        destination: Optional messageable to send to instead of the session's channel
     """
     # Get the decision
     decision = session.character.get_decision(decision_number)
@@ -607,50 +625,43 @@ async def send_decision(bot, session, decision_number: int):
         return
     
     # Get the channel
-    channel = bot.get_channel(session.channel_id)
+    channel = destination or bot.get_channel(session.channel_id)
     if not channel:
         logger.error(f"Channel {session.channel_id} not found")
         return
     
-    # Create embed
-    embed = discord.Embed(
-        title=f"Decision {decision_number}: {session.character.name} ({decision['year']})",
-        description=decision['context'],
-        color=config.EMBED_COLOR
-    )
-    
-    # Add question
-    embed.add_field(name="Decision", value=decision['question'], inline=False)
-    
-    # Add choices
-    choices_text = ""
-    for choice_id, choice_data in decision['choices'].items():
-        choices_text += f"**Option {choice_id.upper()}**: {choice_data['text']}\n\n"
-    
-    embed.add_field(name="Options", value=choices_text, inline=False)
+    # Create embed from the decision's prebuilt content
+    embed = session.character.get_decision_embed(decision_number)
     
     # Add progress
     total_decisions = session.character.get_total_decisions()
     progress = f"Decision {decision_number} of {total_decisions} | Score: {session.total_score}"
     embed.set_footer(text=progress)
     
-    # Get game manager cog
-    game_manager = bot.get_cog('GameManager')
-    if not game_manager:
-        logger.error("GameManager cog not found")
-        return
-    
     # Create view with decision buttons
-    view = DecisionView(session.id, decision_number, decision['choices'], game_manager)
+    view = DecisionView(session, decision_number)
     
     # Send message
-    message = await channel.send(content=f"<@{session.user_id}>, it's time to make a decision:", embed=embed, view=view)
+    embeds = [intro_embed, embed] if intro_embed else [embed]
+    message = await channel.send(content=f"<@{session.user_id}>, it's time to make a decision:", embeds=embeds, view=view)
     
     # Store message ID in session
     session.message_id = message.id
+
+async def send_decision_later(bot, session, decision_number: int, delay: float):
+    """Send a decision message after a delay.
     
-    # Store message reference in view for timeout handling
-    view.message = message
+    Args:
+        bot: The Discord bot
+        session: The GameSession object
+        decision_number: The decision number
+        delay: Seconds to wait before sending
+    """
+    await asyncio.sleep(delay)
+    try:
+        await send_decision(bot, session, decision_number)
+    except Exception as e:
+        logger.error(f"Error sending decision {decision_number} for session {session.id}: {e}")
 
 async def show_game_results(bot, session):
     """Show the final results of a game.
@@ -672,7 +683,7 @@ async def show_game_results(bot, session):
     embed = discord.Embed(
         title=f"Game Completed: {session.character.name}",
         description=f"You've completed all decisions as {session.character.name}!",
-        color=config.EMBED_COLOR
+        color=_EMBED_COLOR
     )
     
     # Add score
@@ -694,7 +705,7 @@ async def show_game_results(bot, session):
     
     # Add principles if available
     if analysis['principles']:
-        principles = "\n".join([f"• {principle}" for principle in analysis['principles']])
+        principles = "\n".join(f"• {principle}" for principle in analysis['principles'])
         embed.add_field(name="Key Takeaways", value=principles, inline=False)
     
     # Get feedback cog
@@ -706,7 +717,7 @@ async def show_game_results(bot, session):
         return
     
     # Create feedback view
-    view = await feedback_cog.create_feedback_view(session.id)
+    view = feedback_cog.create_feedback_view(session.id)
     
     # Send results with feedback button
     await channel.send(
@@ -717,4 +728,5 @@ async def show_game_results(bot, session):
 
 async def setup(bot: commands.Bot) -> None:
     """Set up the UserInterface cog."""
+    bot.add_dynamic_items(ChoiceButton)
     await bot.add_cog(UserInterface(bot))
@@ -12,7 +12,9 @@ load_dotenv()
 
 # Discord configuration
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
-V1SIM_CHANNEL_ID = int(os.getenv('DISCORD_V1SIM_CHANNEL_ID'))
+# Game channel ID; 0 (matches no channel) if unset so importing config never fails
+_v1sim_channel_id = os.getenv('DISCORD_V1SIM_CHANNEL_ID', '').strip()
+V1SIM_CHANNEL_ID = int(_v1sim_channel_id) if _v1sim_channel_id.isdigit() else 0
 
 # Bot configuration
 BOT_PREFIX = '!'
@@ -22,7 +24,11 @@ BOT_STATUS = 'Financial Simulator'
 # Game configuration
 CHARACTERS_DIR = 'characters'
 DATABASE_PATH = 'DB/game_data.db'
+CHARACTER_CACHE_PATH = 'DB/character_cache.pkl'  # Parsed character files, kept out of the characters directory
 GAME_TIMEOUT = 300  # Seconds before a game session times out due to inactivity
+LEADERBOARD_CACHE_TTL = 30  # Seconds to reuse a leaderboard query result
+STATS_CACHE_TTL = 5  # Seconds to reuse a user statistics query result
+ANALYTICS_CACHE_TTL = 60  # Seconds to reuse an analytics report query result
 
 # Feedback configuration
 FEEDBACK_COOLDOWN = 60  # Seconds before a user can submit feedback again
@@ -36,14 +42,14 @@ SUCCESS_COLOR = 0x55FF55  # Green color for success embeds
 INFO_COLOR = 0xFFAA00  # Orange color for info embeds
 
 # Character validation
-REQUIRED_CHARACTER_FIELDS = [
+REQUIRED_CHARACTER_FIELDS = frozenset({
     'name', 'title', 'starting_year', 'initial_capital', 
     'key_principles', 'decisions', 'analysis_templates'
-]
+})
 
-REQUIRED_DECISION_FIELDS = [
+REQUIRED_DECISION_FIELDS = frozenset({
     'year', 'context', 'question', 'choices', 'correct_choice'
-]
+})
 
 # Command cooldowns (in seconds)
 COOLDOWNS = {
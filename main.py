@@ -9,27 +9,44 @@ The bot is built with discord.py and uses cogs for modularity.
 """
 
 import os
+import queue
 import logging
+import logging.handlers
 import asyncio
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+import config
+
 # Set up logging
+# Records are queued on the event loop thread and written to the file and console
+# by a background listener, so logging never blocks on disk I/O
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler("discord_bot.log"),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("discord_bot.log"),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # The listener's handlers add the timestamp, logger name and level
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 logger = logging.getLogger("discord_bot")
 
 # Load environment variables
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
-CHANNEL_ID = int(os.getenv('DISCORD_V1SIM_CHANNEL_ID'))
+CHANNEL_ID = config.V1SIM_CHANNEL_ID
+
+# Maximum number of prefix commands processed at once; further messages wait for a slot
+MAX_CONCURRENT_COMMANDS = 32
+command_slots = None  # asyncio.Semaphore, created in main() on the running loop
 
 # Define intents
 intents = discord.Intents.default()
@@ -48,7 +65,7 @@ initial_cogs = [
     'cogs.feedback'
 ]
 
-def get_help_embed():
+def _build_help_embed():
     """
     Creates an embed with help information about the bot's commands and functionality.
     
@@ -100,6 +117,9 @@ def get_help_embed():
     
     return embed
 
+# The help guide never changes, so build it once and reuse it on every reconnect
+HELP_EMBED = _build_help_embed()
+
 @bot.event
 async def on_ready():
     """Event triggered when the bot is ready and connected to Discord."""
@@ -124,8 +144,7 @@ async def on_ready():
             await channel.send(f"🚀 **{bot.user.name}** is now online and ready for trading! 📈")
             
             # Send help information
-            help_embed = get_help_embed()
-            await channel.send("Here's a quick guide to get you started:", embed=help_embed)
+            await channel.send("Here's a quick guide to get you started:", embed=HELP_EMBED)
             
             logger.info(f"Sent online notification and help guide to channel {CHANNEL_ID}")
         else:
@@ -144,8 +163,9 @@ async def on_message(message):
     if message.channel.id != CHANNEL_ID and not isinstance(message.channel, discord.DMChannel):
         return
     
-    # Process commands
-    await bot.process_commands(message)
+    # Process commands, waiting for a free slot when a burst is already in flight
+    async with command_slots:
+        await bot.process_commands(message)
 
 @bot.event
 async def on_command_error(ctx, error):
@@ -161,6 +181,10 @@ async def on_command_error(ctx, error):
         await ctx.send(f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.")
         return
     
+    # Check failures are reported by the cog's own error handler
+    if isinstance(error, commands.CheckFailure) and ctx.cog is not None and ctx.cog.has_error_handler():
+        return
+    
     # Log other errors
     logger.error(f"Command error: {error}")
     await ctx.send("An error occurred while processing the command.")
@@ -176,6 +200,9 @@ async def load_cogs():
 
 async def main():
     """Main function to start the bot."""
+    global command_slots
+    command_slots = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+    
     # Create necessary directories if they don't exist
     os.makedirs("DB", exist_ok=True)
     
@@ -187,4 +214,8 @@ async def main():
         await bot.start(TOKEN)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    log_listener.start()
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
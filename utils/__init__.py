@@ -4,7 +4,22 @@ Utils package for TMDiscord Bot.
 This package contains utility modules for the bot.
 """
 
-from utils.embed_builder import *
-from utils.yaml_parser import *
-from utils.session_manager import *
-from utils.analytics import *
+from utils.embed_builder import (
+    create_basic_embed,
+    create_error_embed,
+    create_success_embed,
+    create_info_embed,
+    create_character_embed,
+    create_decision_embed,
+    create_outcome_embed,
+    create_results_embed,
+)
+from utils.yaml_parser import (
+    load_yaml_file,
+    validate_character_data,
+    get_all_character_files,
+    load_all_characters,
+    save_character_file,
+)
+from utils.session_manager import SessionManager
+from utils.analytics import Analytics
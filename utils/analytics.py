@@ -4,15 +4,19 @@ Analytics Utility for TMDiscord Bot
 This module provides utility functions for analyzing game data and generating reports.
 """
 
+import time
 import logging
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
+import sqlite3
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple, Union
 
 import config
 
 # Set up logging
 logger = logging.getLogger("discord_bot.analytics")
 
+# Upper bound on the number of memoized query results
+_CACHE_MAX_ENTRIES = 256
+
 class Analytics:
     """Class for analyzing game data."""
     
@@ -23,8 +27,44 @@ class Analytics:
             database_cog: The Database cog
         """
         self.database = database_cog
+        
+        # Memoized query results: (method name, *args) -> (monotonic timestamp, write version, result)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, int, Any]] = {}
+    
+    async def _cached(self, key: Tuple[Any, ...], func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Return a cached result for key, or compute and cache it.
+        
+        Entries expire after config.ANALYTICS_CACHE_TTL seconds, or as soon as the
+        Database cog records a write. Expired and excess entries are evicted
+        whenever a result is stored.
+        
+        Args:
+            key: Cache key, the method name followed by its arguments
+            func: Coroutine function that runs the query
+            *args: Arguments passed to func
+            
+        Returns:
+            The (possibly cached) query result
+        """
+        version = self.database.write_version
+        entry = self._cache.get(key)
+        if entry and entry[1] == version and time.monotonic() - entry[0] < config.ANALYTICS_CACHE_TTL:
+            return entry[2]
+        
+        result = await func(*args)
+        now = time.monotonic()
+        
+        # Entries are re-inserted on every store, so the oldest are at the front
+        self._cache.pop(key, None)
+        for old_key in list(self._cache):
+            stored_at, stored_version, _ = self._cache[old_key]
+            if stored_version == version and now - stored_at < config.ANALYTICS_CACHE_TTL and len(self._cache) < _CACHE_MAX_ENTRIES:
+                break
+            del self._cache[old_key]
+        self._cache[key] = (now, version, result)
+        return result
     
-    def get_popular_characters(self, limit: int = 5) -> List[Dict[str, Any]]:
+    async def get_popular_characters(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get the most popular characters.
         
         Args:
@@ -34,23 +74,26 @@ class Analytics:
             List of character dictionaries with play count
         """
         try:
-            cursor = self.database.connection.cursor()
-            cursor.execute(
-                """
-                SELECT character_id, COUNT(*) as count 
-                FROM games 
-                GROUP BY character_id 
-                ORDER BY count DESC 
-                LIMIT ?
-                """,
-                (limit,)
-            )
-            return cursor.fetchall()
+            return await self._cached(('popular_characters', limit), self.database.run_read, self._get_popular_characters, limit)
         except Exception as e:
             logger.error(f"Error getting popular characters: {e}")
             return []
     
-    def get_highest_scoring_games(self, limit: int = 5) -> List[Dict[str, Any]]:
+    def _get_popular_characters(self, cursor: sqlite3.Cursor, limit: int = 5) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_popular_characters`."""
+        cursor.execute(
+            """
+            SELECT character_id, COUNT(*) as count 
+            FROM games 
+            GROUP BY character_id 
+            ORDER BY count DESC 
+            LIMIT ?
+            """,
+            (limit,)
+        )
+        return cursor.fetchall()
+    
+    async def get_highest_scoring_games(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get the highest scoring games.
         
         Args:
@@ -60,24 +103,27 @@ class Analytics:
             List of game dictionaries
         """
         try:
-            cursor = self.database.connection.cursor()
-            cursor.execute(
-                """
-                SELECT g.game_id, g.character_id, g.total_score, u.username, g.timestamp
-                FROM games g
-                JOIN users u ON g.user_id = u.user_id
-                WHERE g.completed = 1
-                ORDER BY g.total_score DESC
-                LIMIT ?
-                """,
-                (limit,)
-            )
-            return cursor.fetchall()
+            return await self._cached(('highest_scoring_games', limit), self.database.run_read, self._get_highest_scoring_games, limit)
         except Exception as e:
             logger.error(f"Error getting highest scoring games: {e}")
             return []
     
-    def get_recent_games(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _get_highest_scoring_games(self, cursor: sqlite3.Cursor, limit: int = 5) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_highest_scoring_games`."""
+        cursor.execute(
+            """
+            SELECT g.game_id, g.character_id, g.total_score, u.username, g.timestamp
+            FROM games g
+            JOIN users u ON g.user_id = u.user_id
+            WHERE g.completed = 1
+            ORDER BY g.total_score DESC
+            LIMIT ?
+            """,
+            (limit,)
+        )
+        return cursor.fetchall()
+    
+    async def get_recent_games(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the most recent games.
         
         Args:
@@ -87,23 +133,26 @@ class Analytics:
             List of game dictionaries
         """
         try:
-            cursor = self.database.connection.cursor()
-            cursor.execute(
-                """
-                SELECT g.game_id, g.character_id, g.total_score, u.username, g.timestamp, g.completed
-                FROM games g
-                JOIN users u ON g.user_id = u.user_id
-                ORDER BY g.timestamp DESC
-                LIMIT ?
-                """,
-                (limit,)
-            )
-            return cursor.fetchall()
+            return await self._cached(('recent_games', limit), self.database.run_read, self._get_recent_games, limit)
         except Exception as e:
             logger.error(f"Error getting recent games: {e}")
             return []
     
-    def get_active_users(self, days: int = 7) -> List[Dict[str, Any]]:
+    def _get_recent_games(self, cursor: sqlite3.Cursor, limit: int = 10) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_recent_games`."""
+        cursor.execute(
+            """
+            SELECT g.game_id, g.character_id, g.total_score, u.username, g.timestamp, g.completed
+            FROM games g
+            JOIN users u ON g.user_id = u.user_id
+            ORDER BY g.timestamp DESC
+            LIMIT ?
+            """,
+            (limit,)
+        )
+        return cursor.fetchall()
+    
+    async def get_active_users(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get the most active users in the last X days.
         
         Args:
@@ -113,94 +162,61 @@ class Analytics:
             List of user dictionaries with game count
         """
         try:
-            cursor = self.database.connection.cursor()
-            cutoff_date = datetime.now() - timedelta(days=days)
-            cursor.execute(
-                """
-                SELECT u.user_id, u.username, COUNT(*) as game_count
-                FROM games g
-                JOIN users u ON g.user_id = u.user_id
-                WHERE g.timestamp > ?
-                GROUP BY u.user_id
-                ORDER BY game_count DESC
-                """,
-                (cutoff_date,)
-            )
-            return cursor.fetchall()
+            return await self._cached(('active_users', days), self.database.run_read, self._get_active_users, days)
         except Exception as e:
             logger.error(f"Error getting active users: {e}")
             return []
     
-    def get_average_score_by_character(self) -> List[Dict[str, Any]]:
+    def _get_active_users(self, cursor: sqlite3.Cursor, days: int = 7) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_active_users`."""
+        # Compute the cutoff in SQLite so it has the same UTC text format as the
+        # CURRENT_TIMESTAMP values stored in games.timestamp
+        cursor.execute(
+            """
+            SELECT u.user_id, u.username, COUNT(*) as game_count
+            FROM games g
+            JOIN users u ON g.user_id = u.user_id
+            WHERE g.timestamp > datetime('now', ?)
+            GROUP BY u.user_id
+            ORDER BY game_count DESC
+            """,
+            (f"-{days} days",)
+        )
+        return cursor.fetchall()
+    
+    async def get_average_score_by_character(self) -> List[Dict[str, Any]]:
         """Get the average score for each character.
         
         Returns:
             List of character dictionaries with average score
         """
         try:
-            cursor = self.database.connection.cursor()
-            cursor.execute(
-                """
-                SELECT character_id, AVG(total_score) as avg_score, COUNT(*) as play_count
-                FROM games
-                WHERE completed = 1
-                GROUP BY character_id
-                ORDER BY avg_score DESC
-                """
-            )
-            return cursor.fetchall()
+            return await self._cached(('average_score_by_character',), self.database.run_read, self._get_average_score_by_character)
         except Exception as e:
             logger.error(f"Error getting average score by character: {e}")
             return []
     
-    def get_feedback_stats(self) -> Dict[str, Any]:
+    def _get_average_score_by_character(self, cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_average_score_by_character`."""
+        cursor.execute(
+            """
+            SELECT character_id, AVG(total_score) as avg_score, COUNT(*) as play_count
+            FROM games
+            WHERE completed = 1
+            GROUP BY character_id
+            ORDER BY avg_score DESC
+            """
+        )
+        return cursor.fetchall()
+    
+    async def get_feedback_stats(self) -> Dict[str, Any]:
         """Get feedback statistics.
         
         Returns:
             Dictionary with feedback statistics
         """
         try:
-            cursor = self.database.connection.cursor()
-            
-            # Get average rating
-            cursor.execute(
-                """
-                SELECT AVG(rating) as avg_rating, COUNT(*) as count
-                FROM feedback
-                """
-            )
-            rating_stats = cursor.fetchone()
-            
-            # Get rating distribution
-            cursor.execute(
-                """
-                SELECT rating, COUNT(*) as count
-                FROM feedback
-                GROUP BY rating
-                ORDER BY rating
-                """
-            )
-            rating_distribution = cursor.fetchall()
-            
-            # Get recent feedback
-            cursor.execute(
-                """
-                SELECT f.rating, f.comments, g.character_id, u.username, f.timestamp
-                FROM feedback f
-                JOIN games g ON f.game_id = g.game_id
-                JOIN users u ON g.user_id = u.user_id
-                ORDER BY f.timestamp DESC
-                LIMIT 5
-                """
-            )
-            recent_feedback = cursor.fetchall()
-            
-            return {
-                'avg_rating': rating_stats['avg_rating'] if rating_stats and rating_stats['avg_rating'] else 0,
-                'count': rating_stats['count'] if rating_stats else 0,
-                'distribution': rating_distribution,
-                'recent': recent_feedback
-            }
+            return await self._cached(('feedback_stats',), self.database.run_read, self._get_feedback_stats)
         except Exception as e:
             logger.error(f"Error getting feedback stats: {e}")
             return {
@@ -210,7 +226,42 @@ class Analytics:
                 'recent': []
             }
     
-    def get_decision_stats(self, character_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _get_feedback_stats(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+        """Blocking implementation of :meth:`get_feedback_stats`."""
+        # Get rating distribution, and derive the count and average rating from it
+        cursor.execute(
+            """
+            SELECT rating, COUNT(*) as count
+            FROM feedback
+            GROUP BY rating
+            ORDER BY rating
+            """
+        )
+        rating_distribution = cursor.fetchall()
+        count = sum(row[1] for row in rating_distribution)
+        avg_rating = sum(row[0] * row[1] for row in rating_distribution) / count if count else 0
+        
+        # Get recent feedback
+        cursor.execute(
+            """
+            SELECT f.rating, f.comments, g.character_id, u.username, f.timestamp
+            FROM feedback f
+            JOIN games g ON f.game_id = g.game_id
+            JOIN users u ON g.user_id = u.user_id
+            ORDER BY f.timestamp DESC
+            LIMIT 5
+            """
+        )
+        recent_feedback = cursor.fetchall()
+        
+        return {
+            'avg_rating': avg_rating,
+            'count': count,
+            'distribution': rating_distribution,
+            'recent': recent_feedback
+        }
+    
+    async def get_decision_stats(self, character_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get statistics on decisions made.
         
         Args:
@@ -220,82 +271,48 @@ class Analytics:
             List of decision statistics
         """
         try:
-            cursor = self.database.connection.cursor()
-            
-            if character_id:
-                # Get decision stats for a specific character
-                cursor.execute(
-                    """
-                    SELECT d.decision_number, d.choice_made, COUNT(*) as count
-                    FROM decisions d
-                    JOIN games g ON d.game_id = g.game_id
-                    WHERE g.character_id = ?
-                    GROUP BY d.decision_number, d.choice_made
-                    ORDER BY d.decision_number, count DESC
-                    """,
-                    (character_id,)
-                )
-            else:
-                # Get overall decision stats
-                cursor.execute(
-                    """
-                    SELECT g.character_id, d.decision_number, d.choice_made, COUNT(*) as count
-                    FROM decisions d
-                    JOIN games g ON d.game_id = g.game_id
-                    GROUP BY g.character_id, d.decision_number, d.choice_made
-                    ORDER BY g.character_id, d.decision_number, count DESC
-                    """
-                )
-            
-            return cursor.fetchall()
+            return await self._cached(('decision_stats', character_id), self.database.run_read, self._get_decision_stats, character_id)
         except Exception as e:
             logger.error(f"Error getting decision stats: {e}")
             return []
     
-    def generate_summary_report(self) -> Dict[str, Any]:
+    def _get_decision_stats(self, cursor: sqlite3.Cursor, character_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Blocking implementation of :meth:`get_decision_stats`."""
+        if character_id:
+            # Get decision stats for a specific character
+            cursor.execute(
+                """
+                SELECT d.decision_number, d.choice_made, COUNT(*) as count
+                FROM decisions d
+                JOIN games g ON d.game_id = g.game_id
+                WHERE g.character_id = ?
+                GROUP BY d.decision_number, d.choice_made
+                ORDER BY d.decision_number, count DESC
+                """,
+                (character_id,)
+            )
+        else:
+            # Get overall decision stats
+            cursor.execute(
+                """
+                SELECT g.character_id, d.decision_number, d.choice_made, COUNT(*) as count
+                FROM decisions d
+                JOIN games g ON d.game_id = g.game_id
+                GROUP BY g.character_id, d.decision_number, d.choice_made
+                ORDER BY g.character_id, d.decision_number, count DESC
+                """
+            )
+        
+        return cursor.fetchall()
+    
+    async def generate_summary_report(self) -> Dict[str, Any]:
         """Generate a summary report of all game data.
         
         Returns:
             Dictionary with summary statistics
         """
         try:
-            cursor = self.database.connection.cursor()
-            
-            # Get total users
-            cursor.execute("SELECT COUNT(*) as count FROM users")
-            total_users = cursor.fetchone()['count']
-            
-            # Get total games
-            cursor.execute("SELECT COUNT(*) as count FROM games")
-            total_games = cursor.fetchone()['count']
-            
-            # Get completed games
-            cursor.execute("SELECT COUNT(*) as count FROM games WHERE completed = 1")
-            completed_games = cursor.fetchone()['count']
-            
-            # Get average score
-            cursor.execute("SELECT AVG(total_score) as avg_score FROM games WHERE completed = 1")
-            avg_score = cursor.fetchone()['avg_score']
-            
-            # Get popular characters
-            popular_characters = self.get_popular_characters(3)
-            
-            # Get highest scoring games
-            highest_scoring = self.get_highest_scoring_games(3)
-            
-            # Get feedback stats
-            feedback = self.get_feedback_stats()
-            
-            return {
-                'total_users': total_users,
-                'total_games': total_games,
-                'completed_games': completed_games,
-                'completion_rate': (completed_games / total_games * 100) if total_games > 0 else 0,
-                'avg_score': avg_score or 0,
-                'popular_characters': popular_characters,
-                'highest_scoring': highest_scoring,
-                'feedback': feedback
-            }
+            return await self._cached(('summary_report',), self._build_summary_report)
         except Exception as e:
             logger.error(f"Error generating summary report: {e}")
             return {
@@ -313,3 +330,42 @@ class Analytics:
                     'recent': []
                 }
             }
+    
+    async def _build_summary_report(self) -> Dict[str, Any]:
+        """Compose the uncached payload for :meth:`generate_summary_report`."""
+        total_users, total_games, completed_games, avg_score = await self.database.run_read(self._get_summary_totals)
+        
+        # Get popular characters
+        popular_characters = await self.get_popular_characters(3)
+        
+        # Get highest scoring games
+        highest_scoring = await self.get_highest_scoring_games(3)
+        
+        # Get feedback stats
+        feedback = await self.get_feedback_stats()
+        
+        return {
+            'total_users': total_users,
+            'total_games': total_games,
+            'completed_games': completed_games,
+            'completion_rate': (completed_games / total_games * 100) if total_games > 0 else 0,
+            'avg_score': avg_score or 0,
+            'popular_characters': popular_characters,
+            'highest_scoring': highest_scoring,
+            'feedback': feedback
+        }
+    
+    def _get_summary_totals(self, cursor: sqlite3.Cursor) -> Tuple[int, int, int, Optional[float]]:
+        """Blocking query for the totals in :meth:`generate_summary_report`."""
+        # Get total users, total games, completed games and average score in one statement
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM users) as total_users,
+                COUNT(*) as total_games,
+                COUNT(CASE WHEN completed = 1 THEN 1 END) as completed_games,
+                AVG(CASE WHEN completed = 1 THEN total_score END) as avg_score
+            FROM games
+            """
+        )
+        return tuple(cursor.fetchone())
@@ -89,7 +89,7 @@ def create_character_embed(character) -> discord.Embed:
     
     # Add key principles
     if character.key_principles:
-        principles = "\n".join([f"• {principle}" for principle in character.key_principles])
+        principles = "\n".join(f"• {principle}" for principle in character.key_principles)
         embed.add_field(name="Key Principles", value=principles, inline=False)
     
     # Add game info
@@ -121,9 +121,10 @@ def create_decision_embed(character, decision_number: int, decision: dict) -> di
     embed.add_field(name="Decision", value=decision['question'], inline=False)
     
     # Add choices
-    choices_text = ""
-    for choice_id, choice_data in decision['choices'].items():
-        choices_text += f"**Option {choice_id.upper()}**: {choice_data['text']}\n\n"
+    choices_text = "".join(
+        f"**Option {choice_id.upper()}**: {choice_data['text']}\n\n"
+        for choice_id, choice_data in decision['choices'].items()
+    )
     
     embed.add_field(name="Options", value=choices_text, inline=False)
     
@@ -203,7 +204,7 @@ def create_results_embed(character, analysis: dict) -> discord.Embed:
     
     # Add principles if available
     if analysis['principles']:
-        principles = "\n".join([f"• {principle}" for principle in analysis['principles']])
+        principles = "\n".join(f"• {principle}" for principle in analysis['principles'])
         embed.add_field(name="Key Takeaways", value=principles, inline=False)
     
     return embed
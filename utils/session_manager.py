@@ -4,8 +4,11 @@ Session Manager Utility for TMDiscord Bot
 This module provides utility functions for managing game sessions.
 """
 
-import uuid
+import time
 import logging
+import secrets
+import itertools
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 
@@ -16,13 +19,19 @@ import config
 # Set up logging
 logger = logging.getLogger("discord_bot.session_manager")
 
+# Session IDs are a per-process random prefix plus a counter, matching GameSession
+_PROCESS_NONCE = secrets.token_hex(4)
+_SESSION_COUNTER = itertools.count(1)
+
 class SessionManager:
     """Class for managing game sessions."""
     
     def __init__(self):
         """Initialize the SessionManager."""
-        self.active_sessions: Dict[str, Any] = {}
-        self.user_sessions: Dict[int, str] = {}  # user_id -> session_id
+        # Kept in last-activity order (least recently active first) so expiry
+        # checks can stop at the first session that is still live
+        self.active_sessions: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.user_sessions: Dict[int, Dict[str, Any]] = {}  # user_id -> session
     
     def create_session(self, user_id: int, data: Any) -> str:
         """Create a new session.
@@ -35,7 +44,7 @@ class SessionManager:
             The session ID
         """
         # Generate a unique session ID
-        session_id = str(uuid.uuid4())
+        session_id = f"{_PROCESS_NONCE}-{next(_SESSION_COUNTER)}"
         
         # Create session with timestamp
         session = {
@@ -43,20 +52,19 @@ class SessionManager:
             'user_id': user_id,
             'data': data,
             'created_at': datetime.now(),
-            'last_activity': datetime.now()
+            'last_activity': time.monotonic()
         }
         
         # Store session
         self.active_sessions[session_id] = session
         
         # If user already has a session, end it
-        if user_id in self.user_sessions:
-            old_session_id = self.user_sessions[user_id]
-            if old_session_id in self.active_sessions:
-                self.end_session(old_session_id)
+        old_session = self.user_sessions.get(user_id)
+        if old_session is not None:
+            self.end_session(old_session['id'])
         
         # Associate user with session
-        self.user_sessions[user_id] = session_id
+        self.user_sessions[user_id] = session
         
         logger.info(f"Created session: {session_id} for user {user_id}")
         
@@ -82,16 +90,7 @@ class SessionManager:
         Returns:
             The session data or None if not found
         """
-        if user_id not in self.user_sessions:
-            return None
-        
-        session_id = self.user_sessions[user_id]
-        if session_id not in self.active_sessions:
-            # Session ID exists but session doesn't - clean up
-            del self.user_sessions[user_id]
-            return None
-        
-        return self.active_sessions[session_id]
+        return self.user_sessions.get(user_id)
     
     def update_session_activity(self, session_id: str) -> bool:
         """Update the last activity timestamp for a session.
@@ -105,7 +104,8 @@ class SessionManager:
         if session_id not in self.active_sessions:
             return False
         
-        self.active_sessions[session_id]['last_activity'] = datetime.now()
+        self.active_sessions[session_id]['last_activity'] = time.monotonic()
+        self.active_sessions.move_to_end(session_id)
         return True
     
     def update_session_data(self, session_id: str, data: Any) -> bool:
@@ -134,18 +134,15 @@ class SessionManager:
         Returns:
             True if successful, False otherwise
         """
-        if session_id not in self.active_sessions:
+        # Remove session
+        session = self.active_sessions.pop(session_id, None)
+        if session is None:
             return False
         
-        session = self.active_sessions[session_id]
-        
         # Remove user association
-        if session['user_id'] in self.user_sessions and self.user_sessions[session['user_id']] == session_id:
+        if self.user_sessions.get(session['user_id']) is session:
             del self.user_sessions[session['user_id']]
         
-        # Remove session
-        del self.active_sessions[session_id]
-        
         logger.info(f"Ended session: {session_id}")
         
         return True
@@ -162,13 +159,15 @@ class SessionManager:
         if timeout is None:
             timeout = config.GAME_TIMEOUT
         
-        now = datetime.now()
+        cutoff = time.monotonic() - timeout
         inactive_sessions = []
         
+        # Sessions are ordered by last activity, so everything after the first
+        # live session is live too
         for session_id, session in self.active_sessions.items():
-            time_diff = (now - session['last_activity']).total_seconds()
-            if time_diff > timeout:
-                inactive_sessions.append(session_id)
+            if session['last_activity'] >= cutoff:
+                break
+            inactive_sessions.append(session_id)
         
         return inactive_sessions
     
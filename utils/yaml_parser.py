@@ -8,16 +8,40 @@ for character data.
 import os
 import logging
 import yaml
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 import config
 
+# Prefer the libyaml-backed loader and dumper when available
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+    _HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+    _HAS_LIBYAML = False
+
 # Set up logging
 logger = logging.getLogger("discord_bot.yaml_parser")
 
+if not _HAS_LIBYAML:
+    logger.warning(
+        "libyaml is not available; YAML parsing falls back to the much slower pure-Python "
+        "loader. Install libyaml (e.g. libyaml-dev) and reinstall PyYAML to enable it."
+    )
+
+# Parsed files, reused while unchanged: path -> (mtime_ns, size, data)
+_FILE_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+# Cached character data that already passed validation: path -> data
+_VALIDATED: Dict[str, Any] = {}
+
 def load_yaml_file(filepath: str) -> Optional[Dict[str, Any]]:
     """Load a YAML file and return its contents.
     
+    Files that haven't changed since they were last loaded are not parsed again;
+    the same object is returned, so callers must not modify it.
+    
     Args:
         filepath: Path to the YAML file
         
@@ -25,8 +49,15 @@ def load_yaml_file(filepath: str) -> Optional[Dict[str, Any]]:
         Dictionary of YAML contents or None if loading failed
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            data = yaml.safe_load(file)
+        stat = os.stat(filepath)
+        cached = _FILE_CACHE.get(filepath)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        # Hand libyaml the raw bytes; it decodes UTF-8 itself
+        with open(filepath, 'rb') as file:
+            data = yaml.load(file.read(), Loader=_YamlLoader)
+        _FILE_CACHE[filepath] = (stat.st_mtime_ns, stat.st_size, data)
         return data
     except Exception as e:
         logger.error(f"Error loading YAML file {filepath}: {e}")
@@ -42,38 +73,55 @@ def validate_character_data(character_id: str, data: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    if not isinstance(data, dict):
+        logger.error(f"Character {character_id} is not a mapping")
+        return False
+    
     # Check required fields
-    for field in config.REQUIRED_CHARACTER_FIELDS:
-        if field not in data:
-            logger.error(f"Character {character_id} missing required field: {field}")
-            return False
+    missing = config.REQUIRED_CHARACTER_FIELDS - data.keys()
+    if missing:
+        logger.error(f"Character {character_id} missing required field: {', '.join(sorted(missing))}")
+        return False
     
-    # Check decisions structure
-    decisions = data.get('decisions', {})
+    # Check decisions structure (required fields are known to be present from here on)
+    decisions = data['decisions']
     if not decisions:
         logger.error(f"Character {character_id} has no decisions")
         return False
+    if not isinstance(decisions, dict):
+        logger.error(f"Character {character_id} decisions is not a mapping")
+        return False
     
     for decision_id, decision in decisions.items():
-        for field in config.REQUIRED_DECISION_FIELDS:
-            if field not in decision:
-                logger.error(f"Character {character_id}, decision {decision_id} missing required field: {field}")
-                return False
+        if not isinstance(decision, dict):
+            logger.error(f"Character {character_id}, decision {decision_id} is not a mapping")
+            return False
+        
+        missing = config.REQUIRED_DECISION_FIELDS - decision.keys()
+        if missing:
+            logger.error(f"Character {character_id}, decision {decision_id} missing required field: {', '.join(sorted(missing))}")
+            return False
         
         # Check choices structure
-        choices = decision.get('choices', {})
+        choices = decision['choices']
         if not choices:
             logger.error(f"Character {character_id}, decision {decision_id} has no choices")
             return False
         
+        # Game sessions record each choice as one byte, so choice keys must be single ASCII characters
+        invalid = [choice_id for choice_id in choices if not (isinstance(choice_id, str) and len(choice_id) == 1 and choice_id.isascii())]
+        if invalid:
+            logger.error(f"Character {character_id}, decision {decision_id} has invalid choice keys: {', '.join(map(str, invalid))}")
+            return False
+        
         # Check correct_choice is valid
-        correct_choice = decision.get('correct_choice')
+        correct_choice = decision['correct_choice']
         if correct_choice not in choices:
             logger.error(f"Character {character_id}, decision {decision_id} has invalid correct_choice: {correct_choice}")
             return False
     
     # Check analysis templates
-    analysis_templates = data.get('analysis_templates', {})
+    analysis_templates = data['analysis_templates']
     if not analysis_templates:
         logger.warning(f"Character {character_id} has no analysis templates")
     
@@ -86,12 +134,8 @@ def get_all_character_files() -> List[str]:
         List of character file paths
     """
     try:
-        files = [
-            os.path.join(config.CHARACTERS_DIR, f) 
-            for f in os.listdir(config.CHARACTERS_DIR) 
-            if f.endswith('.yml') or f.endswith('.yaml')
-        ]
-        return files
+        with os.scandir(config.CHARACTERS_DIR) as it:
+            return [e.path for e in it if e.is_file() and e.name.endswith(('.yml', '.yaml'))]
     except FileNotFoundError:
         logger.error(f"Characters directory not found: {config.CHARACTERS_DIR}")
         return []
@@ -107,25 +151,37 @@ def load_all_characters() -> Dict[str, Dict[str, Any]]:
     # Get all YAML files in the characters directory
     files = get_all_character_files()
     
-    # Load each file
-    for filepath in files:
+    # Read and parse files in parallel; validation below stays in file order
+    loaded = []
+    if files:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            loaded = list(executor.map(load_yaml_file, files))
+    
+    # Validate each file
+    for filepath, data in zip(files, loaded):
         filename = os.path.basename(filepath)
         character_id = os.path.splitext(filename)[0]
         
-        data = load_yaml_file(filepath)
-        if data and validate_character_data(character_id, data):
+        if not data:
+            continue
+        
+        # Unchanged files return the same cached object, which only needs validating once
+        if _VALIDATED.get(filepath) is data or validate_character_data(character_id, data):
+            _VALIDATED[filepath] = data
             characters[character_id] = data
-            logger.info(f"Loaded character: {data.get('name', 'Unknown')} ({character_id})")
+            logger.debug(f"Loaded character: {data.get('name', 'Unknown')} ({character_id})")
     
-    logger.info(f"Loaded {len(characters)} characters")
+    # One summary line instead of an INFO record per file
+    logger.info(f"Loaded {len(characters)} characters: {', '.join(characters)}")
     return characters
 
-def save_character_file(character_id: str, data: Dict[str, Any]) -> bool:
+def save_character_file(character_id: str, data: Dict[str, Any], *, skip_validation: bool = False) -> bool:
     """Save character data to a YAML file.
     
     Args:
         character_id: The character ID (filename without extension)
         data: The character data to save
+        skip_validation: Whether to skip validation, for data the caller has already validated
         
     Returns:
         True if successful, False otherwise
@@ -134,13 +190,20 @@ def save_character_file(character_id: str, data: Dict[str, Any]) -> bool:
     
     try:
         # Validate data before saving
-        if not validate_character_data(character_id, data):
+        if not skip_validation and not validate_character_data(character_id, data):
             logger.error(f"Invalid character data for {character_id}")
             return False
         
-        # Save to file
-        with open(filepath, 'w', encoding='utf-8') as file:
-            yaml.dump(data, file, default_flow_style=False, sort_keys=False)
+        # Drop cached parses of the old contents
+        _FILE_CACHE.pop(filepath, None)
+        _VALIDATED.pop(filepath, None)
+        
+        # Save to file: serialize fully first, then swap it in so readers never see a partial write
+        content = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, encoding='utf-8')
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(content)
+        os.replace(tmp_path, filepath)
         
         logger.info(f"Saved character: {data.get('name', 'Unknown')} ({character_id})")
         return True